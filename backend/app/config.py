@@ -22,6 +22,14 @@ class Settings(BaseSettings):
     browser_headless: bool = True
     browser_timeout: int = 30000       # 30초
     page_load_timeout: int = 60000     # 60초
+    scraper_max_pages: int = 8         # 소비자 페이지 크롤러 동시 페이지 수 (공유 컨텍스트, 페이지당 메모리 80~150MB)
+    scraper_warm_pages: int = 2        # 초기화 시 미리 만들어 둘 페이지 수
+    scraper_cache_ttl: float = 300.0   # 같은 상품 URL 크롤링 결과 재사용 시간 (초, 0이면 캐시 끔)
+    scraper_cdp_endpoint: Optional[str] = None    # 이미 실행 중인 브라우저에 CDP로 접속 (여러 워커가 공유)
+    scraper_user_data_dir: Optional[str] = None   # 영구 프로필 디렉터리 (HTTP 디스크 캐시 재사용)
+    scraper_storage_state: Optional[str] = None   # 쿠키/로컬 스토리지 저장 파일 (영구 프로필이 없을 때)
+    scraper_single_process: bool = False          # 메모리가 아주 작은 컨테이너에서만 켬
+    scraper_stealth: str = "full"                 # "full"(playwright_stealth) 또는 "minimal"(인라인 패치)
 
     # 작가웹 설정
     artist_web_base_url: str = "https://artist.idus.com"
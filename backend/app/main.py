@@ -7,6 +7,8 @@ v2: 작가웹 연동 기반 GB 등록 자동화
 """
 import os
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 from typing import Optional, Any
 from fastapi import FastAPI
@@ -23,9 +25,15 @@ from .routers import health, v1, session, products, translation, registration
 load_dotenv()
 
 # 로깅 설정
+# 요청 처리 코루틴은 큐에 레코드만 넣고, 실제 stderr 출력은 별도 리스너 스레드가 담당
+# (동시 크롤링 중 여러 작업이 출력 I/O에 막히지 않도록). 포맷은 QueueHandler가 큐에 넣기 전에 적용
+# 리스너 스레드는 lifespan에서 시작/정지 (모듈 import만으로 스레드가 뜨지 않도록, 시작 전 레코드는 큐에 보관)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
@@ -75,7 +83,16 @@ async def initialize_v1_services():
     # Scraper 초기화
     logger.info("Scraper 초기화...")
     try:
-        scraper = _IdusScraper()
+        scraper = _IdusScraper(
+            max_pages=settings.scraper_max_pages,
+            warm_pages=settings.scraper_warm_pages,
+            cache_ttl=settings.scraper_cache_ttl,
+            cdp_endpoint=settings.scraper_cdp_endpoint,
+            user_data_dir=settings.scraper_user_data_dir,
+            storage_state_path=settings.scraper_storage_state,
+            single_process=settings.scraper_single_process,
+            stealth=settings.scraper_stealth,
+        )
         await scraper.initialize()
         logger.info("Playwright 브라우저 초기화 완료")
     except Exception as e:
@@ -122,6 +139,7 @@ async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
     global artist_session
 
+    _log_listener.start()
     logger.info("서버 시작...")
     logger.info(f"PORT: {os.getenv('PORT', '8000')}")
 
@@ -143,11 +161,17 @@ async def lifespan(app: FastAPI):
     try:
         if scraper:
             await scraper.close()
+        if translator:
+            await translator.aclose()
+        if gb_translator:
+            await gb_translator.aclose()
         if artist_session:
             await artist_session.close()
     except Exception as e:
         logger.warning(f"리소스 정리 중 오류: {e}")
     logger.info("리소스 정리 완료")
+    # 큐에 남은 로그를 모두 출력한 뒤 리스너 스레드 종료
+    _log_listener.stop()
 
 
 # ──────────────── FastAPI 앱 생성 ────────────────
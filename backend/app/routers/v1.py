@@ -208,6 +208,15 @@ async def batch_translate(request: BatchTranslateRequest):
     success_count = 0
     failed_count = 0
 
+    # 크롤링은 공유 브라우저에서 동시에 수행하고, 번역은 기존처럼 순차 처리
+    valid_urls = [url for url in urls if "idus.com" in url]
+    # 결과는 위치 순서대로 소비 (중복 URL도 항목마다 별도 복사본을 받음)
+    try:
+        scraped = iter(await _scraper.scrape_products(valid_urls))
+    except Exception as e:
+        # 크롤러 자체가 실패하면 모든 유효 URL을 실패로 기록
+        scraped = iter([e] * len(valid_urls))
+
     for idx, url in enumerate(urls):
         if "idus.com" not in url:
             results.append(BatchItemResult(
@@ -219,7 +228,9 @@ async def batch_translate(request: BatchTranslateRequest):
             continue
 
         try:
-            product_data = await _scraper.scrape_product(url)
+            product_data = next(scraped)
+            if isinstance(product_data, BaseException):
+                raise product_data
             translated_data = await _translator.translate_product(
                 product_data=product_data,
                 target_language=request.target_language,
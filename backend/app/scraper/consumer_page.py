@@ -1,32 +1,373 @@
 """
 아이디어스(Idus) 상품 크롤링 모듈
-HTML 전체에서 이미지 URL 추출 + 네트워크 캡처 + __NUXT__ 파싱
+상세 영역 이미지 위치 기반 추출 + 네트워크 캡처
 """
 import asyncio
-import json
+import logging
 import re
 import os
+import time
+import weakref
+from collections import OrderedDict
 from typing import Optional
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Response
-from playwright_stealth import stealth_async
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Request, Route
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from ..models.v1 import ProductData, ProductOption
 
+logger = logging.getLogger(__name__)
+
+# 상세 이미지 필터링 제외 패턴 (소문자 URL 대상, 이미지 수집 JS에 전달해 페이지 안에서 검사)
+_IMAGE_EXCLUDE_PATTERNS = (
+    '/icon', '/sprite', '/logo', '/avatar', '/badge',
+    '/emoji', '/button', '/arrow', '/profile',
+    'facebook.', 'twitter.', 'instagram.', 'kakao.', 'naver.',
+    'google.com', 'apple.com',
+    '/escrow', '/membership', '/banner',
+    '/thumbnail', '/thumb_', '_thumb',  # 썸네일 제외
+    '/review/', '/comment/',  # 후기 이미지 제외
+    '/artist/', '/shop/',  # 작가/샵 이미지 제외
+    'data:image',
+    '.svg',  # SVG 제외
+    '_50.', '_100.', '_150.', '_200.', '_250.',  # 작은 크기 이미지 제외
+)
+
+# 폴백(네트워크 캡처) 이미지 엄격 필터 제외 패턴 - URL마다 패턴별 부분 문자열 검색 대신 정규식 한 번으로 검사
+_STRICT_EXCLUDE_RE = re.compile('|'.join(map(re.escape, (
+    '/profile', '/avatar', '/icon', '/badge',
+    '/thumb_', '/thumbnail', '_thumb',
+    '/review', '/comment',
+    '/artist/', '/shop/',
+    '_50.', '_100.', '_150.', '_200.', '_250.', '_300.',
+))))
+
+# Idus CDN URL의 파일 ID / 크기 접미사 (예: files/abc123_720.jpg)
+_FILE_ID_RE = re.compile(r'files/([a-f0-9]+)')
+_SIZE_SUFFIX_RE = re.compile(r'_(\d+)\.')
+
+# 상품 URL의 상품 ID (예: /v2/product/<uuid>) - 경로 형태가 달라도 같은 상품은 같은 캐시 키
+_PRODUCT_ID_RE = re.compile(r'/product/([0-9A-Za-z-]+)')
+
+# 옵션 추출용 JS 헬퍼 - 컨텍스트에 한 번만 주입하고 그룹마다 이름으로 호출
+_OPTION_HELPERS_JS = """
+window.__idusScraper = {
+    findOptionGroup(groupIdx) {
+        const result = { name: null, values: [], headerElement: null };
+
+        // 옵션 그룹 헤더 찾기 (아코디언/드롭다운 형태)
+        // 모든 요소의 innerText를 계산하는 대신, 그룹 번호로 시작하는 텍스트 노드만
+        // 한 번 순회하고 그 조상 중 조건을 만족하는 가장 바깥 요소를 헤더로 사용
+        // "1. 핫케이크 높이" 또는 "1. 기타 옵션" 형태
+        const headerRe = new RegExp('^' + groupIdx + '\\\\.\\\\s*(.+?)(?:\\\\s|$)');
+        const startRe = new RegExp('^\\\\s*' + groupIdx);
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, {
+            acceptNode: n => startRe.test(n.nodeValue) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP
+        });
+        let foundHeader = null;
+        let groupName = null;
+
+        while (!foundHeader && walker.nextNode()) {
+            let el = walker.currentNode.parentElement;
+            while (el && el !== document.body) {
+                const text = (el.innerText || el.textContent || '').trim();
+                if (text.length >= 50) break;
+
+                const headerMatch = text.match(headerRe);
+                if (headerMatch) {
+                    // 클릭 가능한 요소인지 확인
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width > 50 && rect.height > 20) {
+                        groupName = headerMatch[1].trim();
+                        foundHeader = el;
+                    }
+                }
+                el = el.parentElement;
+            }
+        }
+
+        if (groupName) {
+            result.name = groupName;
+
+            // 해당 그룹의 옵션값 찾기
+            // 헤더 다음에 오는 옵션 리스트 탐색
+            if (foundHeader) {
+                let sibling = foundHeader.nextElementSibling;
+                let parent = foundHeader.parentElement;
+
+                // 같은 부모 내에서 옵션값 찾기
+                const searchContainer = parent || document.body;
+                const seen = new Set();
+                const options = searchContainer.querySelectorAll(
+                    '[role="option"], [class*="option-item"], [class*="optionItem"], ' +
+                    'li, [class*="select-item"], [class*="selectItem"]'
+                );
+
+                options.forEach(opt => {
+                    const optText = (opt.innerText || '').trim().split('\\n')[0].trim();
+
+                    // 유효한 옵션값인지 확인
+                    if (optText && optText.length >= 1 && optText.length <= 60) {
+                        const noise = ['선택해주세요', '선택하세요', '확인', '취소', 
+                                      '닫기', '장바구니', '구매하기', '필수', '옵션'];
+                        const isNoise = noise.some(n => optText.includes(n));
+                        const isGroupHeader = /^\\d+\\./.test(optText);
+                        const isPriceOnly = /^[\\d,]+\\s*원?$/.test(optText);
+
+                        if (!isNoise && !isGroupHeader && !isPriceOnly) {
+                            // 가격 정보 제거
+                            let cleanValue = optText.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
+                            if (cleanValue.length >= 1 && !seen.has(cleanValue)) {
+                                seen.add(cleanValue);
+                                result.values.push(cleanValue);
+                            }
+                        }
+                    }
+                });
+
+                // 클릭 전 옵션값 스냅샷 - 펼쳐진 뒤 값이 바뀌었는지 판단하는 기준
+                // (이전 그룹에서 열려 있던 값이나 본문 텍스트 줄은 펼치기 전에도 잡히므로)
+                result.valuesBefore = this.collectGroupValues({ groupIdx, groupName });
+
+                // 그룹 헤더 클릭 (아코디언 펼치기) - 별도 요소 탐색/클릭 왕복 없이 바로 처리
+                foundHeader.click();
+                result.clicked = true;
+            }
+        }
+
+        return result;
+    },
+
+    collectGroupValues(args) {
+        const values = [];
+        const seen = new Set();
+        const groupIdx = args.groupIdx;
+        const groupName = args.groupName;
+
+        // 화면에 보이는 모든 텍스트에서 옵션값 패턴 찾기
+        // 특히 아코디언/드롭다운이 펼쳐진 상태에서
+
+        // 방법 1: role="option" 또는 li 요소
+        const optionElements = document.querySelectorAll(
+            '[role="option"], [role="listitem"], ' +
+            '[class*="option-item"], [class*="optionItem"], ' +
+            '[class*="select-item"], [class*="selectItem"], ' +
+            '[class*="dropdown-item"], [class*="dropdownItem"]'
+        );
+
+        optionElements.forEach(el => {
+            const rect = el.getBoundingClientRect();
+            // 화면에 보이는 요소만
+            if (rect.width > 0 && rect.height > 0) {
+                const text = (el.innerText || '').trim().split('\\n')[0].trim();
+
+                if (text && text.length >= 1 && text.length <= 60) {
+                    const noise = ['선택해', '확인', '취소', '닫기', '필수', '옵션 선택'];
+                    const isNoise = noise.some(n => text.includes(n));
+                    const isGroupHeader = /^\\d+\\./.test(text);
+                    const isPriceOnly = /^[\\d,]+\\s*원?$/.test(text);
+
+                    if (!isNoise && !isGroupHeader && !isPriceOnly) {
+                        let cleanValue = text.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
+                        if (cleanValue.length >= 1 && !seen.has(cleanValue)) {
+                            seen.add(cleanValue);
+                            values.push(cleanValue);
+                        }
+                    }
+                }
+            }
+        });
+
+        // 방법 2: 그룹 헤더 아래의 텍스트 라인들
+        if (values.length === 0) {
+            const allText = document.body.innerText || '';
+            const lines = allText.split('\\n');
+            let inGroup = false;
+
+            for (let i = 0; i < lines.length; i++) {
+                const line = lines[i].trim();
+
+                // 현재 그룹 헤더 발견
+                if (line.startsWith(groupIdx + '.') || line.includes(groupName)) {
+                    inGroup = true;
+                    continue;
+                }
+
+                // 다음 그룹 헤더 발견 시 종료
+                if (inGroup && /^\\d+\\./.test(line)) {
+                    break;
+                }
+
+                // 옵션값 수집
+                if (inGroup && line.length >= 1 && line.length <= 60) {
+                    const noise = ['선택해', '확인', '취소', '닫기', '필수', '옵션'];
+                    const isNoise = noise.some(n => line.includes(n));
+                    const isPriceOnly = /^[\\d,]+\\s*원?$/.test(line);
+
+                    if (!isNoise && !isPriceOnly && !/^\\d+\\./.test(line)) {
+                        let cleanValue = line.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
+                        if (cleanValue.length >= 1 && !seen.has(cleanValue)) {
+                            seen.add(cleanValue);
+                            values.push(cleanValue);
+                        }
+                    }
+                }
+            }
+        }
+
+        return values;
+    },
+};
+"""
+
+# 최소 지문 패치 (stealth="minimal") - playwright_stealth 전체 패치 대신 헤드리스 티가 나는 항목만 덮어씀
+_MINIMAL_STEALTH_JS = """
+Object.defineProperty(Navigator.prototype, 'webdriver', { get: () => undefined });
+Object.defineProperty(Navigator.prototype, 'languages', { get: () => ['ko-KR', 'ko', 'en-US', 'en'] });
+if (!window.chrome) window.chrome = { runtime: {} };
+"""
+
+# 크롤링에 불필요한 리소스 타입 (요청 자체를 차단)
+# 이미지/스타일시트는 상세 이미지의 크기·가시성 판별과 네트워크 캡처에 필요하므로 유지
+_BLOCKED_RESOURCE_TYPES = frozenset({'font', 'media', 'texttrack', 'manifest'})
+
+# 트래킹/광고 호스트 (서브도메인 포함) - 추출 결과와 무관하고 네트워크 유휴 상태만 늦춤
+_BLOCKED_HOSTS = frozenset({
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googleadservices.com', 'googlesyndication.com',
+    'facebook.com', 'facebook.net', 'analytics.tiktok.com',
+    'criteo.com', 'criteo.net', 'hotjar.com', 'mixpanel.com',
+    'wcs.naver.net', 'bat.bing.com', 'clarity.ms',
+})
+
+
+def _is_blocked_host(host: str) -> bool:
+    """호스트 자신 또는 상위 도메인이 차단 목록에 있는지 확인 (집합 조회만 사용)"""
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in _BLOCKED_HOSTS for i in range(len(parts) - 1))
+
+
+def _should_block_request(resource_type: str, url: str, is_subframe: bool) -> bool:
+    """폰트/미디어 등 불필요한 타입, 트래킹 호스트, 외부 도메인 iframe 문서(광고/위젯)인지 판단
+
+    resource_type은 Playwright 표기(소문자)를 사용합니다. 메인 문서와 idus 도메인 프레임은 유지합니다.
+    """
+    host = urlparse(url).hostname or ''
+    return (
+        resource_type in _BLOCKED_RESOURCE_TYPES
+        or _is_blocked_host(host)
+        or (resource_type == 'document' and is_subframe and 'idus' not in host)
+    )
+
+
+# CDP Fetch 가로채기 패턴 - 차단 후보만 일시정지시키고 나머지 요청은 건드리지 않음 (route와 달리 HTTP 캐시 유지)
+# 호스트 패턴은 와일드카드라 후보를 넓게 잡을 뿐이고, 실제 차단 여부는 _should_block_request로 정확히 판단
+# Document는 가로채지 않음 - 메인 문서 이동까지 Python 응답을 기다리게 되므로 (외부 iframe 차단은 route 대체 경로에서만)
+_BLOCKED_FETCH_PATTERNS = [
+    {'resourceType': resource_type, 'requestStage': 'Request'}
+    for resource_type in ('Font', 'Media', 'TextTrack', 'Manifest')
+] + [{'urlPattern': f'*{host}/*', 'requestStage': 'Request'} for host in sorted(_BLOCKED_HOSTS)]
+
+# 페이지 동작(클릭 등) 기본 제한시간 (ms)
+_ACTION_TIMEOUT_MS = 5000
+
+# 네트워크 캡처 이미지 URL 상한 - 폴백 필터가 최대 20개만 쓰므로 이후 응답은 처리하지 않음
+_NETWORK_IMAGE_CAP = 200
+
+# 작품 설명 최대 길이 (페이지 안에서 잘라서 반환)
+_DESCRIPTION_MAX_CHARS = 6000
+
+# 크롤링 결과 캐시 (같은 상품 재요청/재시도 시 브라우저 작업 생략)
+_CACHE_TTL_SEC = 300.0
+_CACHE_MAX_ENTRIES = 256
+
+# 옵션 영역 후보 (우선순위 순) - Playwright CSS 확장 문법 (:text-is, :has-text)
+_OPTION_AREA_SELECTORS = (
+    ':text-is("옵션을 선택해주세요")',
+    ':text-is("옵션 선택")',
+    '[class*="option-select"]',
+    '[class*="optionSelect"]',
+    'button:has-text("옵션")',
+)
+
+# 열린 옵션 패널 (바텀시트/다이얼로그) - 보이는 요소만 매칭
+_OPTION_PANEL_SELECTOR = ', '.join(f'{sel}:visible' for sel in (
+    '[role="dialog"]', '[role="listbox"]',
+    '[class*="bottom-sheet"]', '[class*="bottomSheet"]',
+    '[class*="option-panel"]', '[class*="optionPanel"]',
+))
+
+
+def _normalize_product_url(url: str) -> str:
+    """캐시 키용 URL 정규화 - 상품 ID 우선, 없으면 호스트 소문자 + 쿼리/프래그먼트/끝 슬래시 제거"""
+    parsed = urlparse(url.strip())
+    match = _PRODUCT_ID_RE.search(parsed.path)
+    if match:
+        return f"product:{match.group(1)}"
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
 
 class IdusScraper:
     """아이디어스 상품 페이지 크롤러"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_pages: int = 8,
+        block_resources: bool = True,
+        warm_pages: int = 2,
+        cache_ttl: float = _CACHE_TTL_SEC,
+        cdp_endpoint: Optional[str] = None,
+        user_data_dir: Optional[str] = None,
+        storage_state_path: Optional[str] = None,
+        single_process: bool = False,
+        stealth: str = "full",
+    ):
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.playwright = None
         self._initialized = False
+        # 폰트/미디어 등 불필요한 리소스 요청 차단 여부
+        self.block_resources = block_resources
+        # (도메인, 필드) → 직전에 성공한 셀렉터 (다음 크롤링에서 먼저 시도)
+        self._hot_selectors: dict[tuple[str, str], str] = {}
+        # 공유 컨텍스트 안에서 동시에 열 수 있는 페이지 수 제한
+        self._page_semaphore = asyncio.Semaphore(max_pages)
+        # 크롤링이 끝난 페이지 재사용 (new_page/close 비용 절감, 최대 max_pages개)
+        self._idle_pages: list[Page] = []
+        # 초기화 시 미리 만들어 둘 페이지 수 (첫 크롤링부터 페이지 생성 비용 없음)
+        self.warm_pages = min(warm_pages, max_pages)
+        # 정규화 URL → (저장 시각, 결과), 오래된 항목부터 제거 (LRU)
+        self._cache: OrderedDict[str, tuple[float, ProductData]] = OrderedDict()
+        self.cache_ttl = cache_ttl
+        # 브라우저 실행 방식 설정 (config.Settings의 scraper_* 값을 main.py에서 전달)
+        self.cdp_endpoint = cdp_endpoint
+        self.user_data_dir = user_data_dir
+        self.single_process = single_process
+        self.stealth = stealth
+        # 쿠키/로컬 스토리지 저장 파일 (종료 시 저장, 다음 초기화 때 복원)
+        self._storage_state_path = storage_state_path
+        # 실제로 사용한 실행 방식: "cdp" | "persistent" | "launch" (initialize에서 결정)
+        self._launch_mode: Optional[str] = None
+        # 정규화 URL → 진행 중인 크롤링 (같은 URL 동시 요청은 브라우저 작업 하나를 공유)
+        self._inflight: dict[str, asyncio.Task] = {}
+        # 페이지별 잠금 - 탭/옵션 패널 클릭처럼 화면 상태를 바꾸는 단계와 그 상태를 읽는 단계를 직렬화
+        self._page_locks: "weakref.WeakKeyDictionary[Page, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        # CDP Fetch.requestPaused 응답 태스크 (완료 전까지 참조 유지)
+        self._fetch_tasks: set[asyncio.Task] = set()
         
-    async def initialize(self):
+    async def initialize(self, cdp_endpoint: Optional[str] = None):
+        """브라우저 초기화
+
+        cdp_endpoint(인자 또는 생성자의 cdp_endpoint)가 있으면 새로 띄우지 않고
+        별도 프로세스에서 실행 중인 브라우저에 CDP로 접속해 여러 워커가 공유합니다.
+        user_data_dir가 있으면 해당 프로필 디렉터리로 영구 컨텍스트를 띄워
+        JS 번들/CSS/공통 이미지 등의 HTTP 디스크 캐시를 재시작 후에도 재사용합니다.
+        그 외에는 storage_state_path 파일에 쿠키/로컬 스토리지를 저장해 두었다가 복원합니다.
+        """
         if self._initialized:
             return
             
-        print("🔧 Playwright 브라우저 초기화 중...")
+        logger.info("Playwright 브라우저 초기화 중...")
         
         try:
             self.playwright = await async_playwright().start()
@@ -44,129 +385,239 @@ class IdusScraper:
             ]
             
             if is_docker:
-                launch_args.append('--single-process')
-                print("🐳 Docker 환경 감지됨")
+                logger.info("Docker 환경 감지됨")
             
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=launch_args
-            )
+            # 단일 프로세스 모드는 렌더러가 하나라 동시 페이지가 JS/레이아웃을 직렬로 처리함 - 기본은 끄고
+            # 메모리가 아주 작은 컨테이너에서만 single_process로 켬 (동시 페이지 수는 max_pages로 제한)
+            if self.single_process:
+                launch_args.append('--single-process')
             
-            self.context = await self.browser.new_context(
+            context_options = dict(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 locale='ko-KR',
             )
             
+            cdp_endpoint = cdp_endpoint or self.cdp_endpoint
+            user_data_dir = self.user_data_dir
+            if cdp_endpoint:
+                self._launch_mode = 'cdp'
+            elif user_data_dir:
+                self._launch_mode = 'persistent'
+            else:
+                self._launch_mode = 'launch'
+            if self._launch_mode != 'persistent' and self._storage_state_path and os.path.exists(self._storage_state_path):
+                # 이전 실행의 쿠키/로컬 스토리지 복원 (재시작 직후 첫 크롤링도 세션이 있는 상태로 시작)
+                context_options['storage_state'] = self._storage_state_path
+            if self._launch_mode == 'cdp':
+                self.browser = await self.playwright.chromium.connect_over_cdp(cdp_endpoint)
+                logger.info("공유 브라우저에 연결: %s", cdp_endpoint)
+                self.context = await self.browser.new_context(**context_options)
+            elif self._launch_mode == 'persistent':
+                # 영구 컨텍스트는 브라우저 객체 없이 컨텍스트만 반환됨
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    user_data_dir,
+                    headless=True,
+                    args=launch_args,
+                    **context_options
+                )
+                logger.info("영구 프로필 사용 (디스크 캐시 재사용): %s", user_data_dir)
+            else:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=True,
+                    args=launch_args
+                )
+                self.context = await self.browser.new_context(**context_options)
+            
+            # 클릭/조회 기본 제한시간 (goto/wait_for_selector는 개별 지정) - 없는 요소에 30초씩 묶이지 않도록
+            self.context.set_default_timeout(_ACTION_TIMEOUT_MS)
+            await self.context.add_init_script(_OPTION_HELPERS_JS)
+            # stealth 패치도 컨텍스트에 한 번만 등록 - 이후 모든 페이지가 상속 (페이지마다 재주입하지 않음)
+            # stealth="minimal"이면 필요한 몇 가지만 인라인 스크립트로 등록 (탐색마다 실행되는 패치 수 감소)
+            if self.stealth == 'minimal':
+                await self.context.add_init_script(_MINIMAL_STEALTH_JS)
+            else:
+                # 지연 import: 스크립트 파일들을 읽어 들이는 모듈이라 실제 브라우저를 띄울 때만 로드
+                # stealth_async는 패치 스크립트마다 add_init_script를 호출하므로 하나로 합쳐 한 번에 등록
+                from playwright_stealth import StealthConfig
+                await self.context.add_init_script(
+                    ';\n'.join(StealthConfig().enabled_scripts)
+                )
+            
+            # 미리 만들어 둘 페이지는 동시에 생성 (페이지마다 CDP 세션 설정 왕복이 있음)
+            self._idle_pages.extend(
+                await asyncio.gather(*(self._new_page() for _ in range(self.warm_pages)))
+            )
+            
             self._initialized = True
-            print("✅ Playwright 브라우저 초기화 완료")
+            logger.info("Playwright 브라우저 초기화 완료")
             
         except Exception as e:
-            print(f"❌ Playwright 초기화 실패: {e}")
+            logger.error("Playwright 초기화 실패: %s", e)
             raise
         
     async def close(self):
-        print("🔧 Playwright 브라우저 종료 중...")
+        logger.info("Playwright 브라우저 종료 중...")
+        # 종료 정리는 최대한 진행 (Exception만 삼키므로 CancelledError는 그대로 전파)
+        # 영구 프로필은 프로필 디렉터리에 이미 저장되므로 별도 저장 파일은 쓰지 않음
+        if self.context and self._storage_state_path and self._launch_mode != 'persistent':
+            try: await self.context.storage_state(path=self._storage_state_path)
+            except Exception as e: logger.debug("브라우저 상태 저장 실패: %s", e)
         if self.context:
             try: await self.context.close()
-            except: pass
+            except Exception as e: logger.debug("컨텍스트 종료 실패: %s", e)
         if self.browser:
             try: await self.browser.close()
-            except: pass
+            except Exception as e: logger.debug("브라우저 종료 실패: %s", e)
         if self.playwright:
             try: await self.playwright.stop()
-            except: pass
+            except Exception as e: logger.debug("Playwright 종료 실패: %s", e)
+        self._idle_pages.clear()
         self._initialized = False
-        print("✅ Playwright 브라우저 종료 완료")
+        logger.info("Playwright 브라우저 종료 완료")
+    
+    async def _block_unneeded_resources(self, route: Route):
+        """폰트/미디어/트래킹/외부 iframe 요청 차단 (CDP를 쓸 수 없을 때의 대체 경로)"""
+        request = route.request
+        if _should_block_request(request.resource_type, request.url, request.frame.parent_frame is not None):
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def scrape_product(self, url: str) -> ProductData:
+        cache_key = _normalize_product_url(url)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            self._cache.move_to_end(cache_key)
+            logger.info("캐시된 크롤링 결과 사용: %s", url)
+            return cached[1].model_copy(deep=True)
+        
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._scrape_and_cache(url, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            logger.info("진행 중인 크롤링 결과 대기: %s", url)
+        
+        # 한 호출자가 취소되어도 같은 결과를 기다리는 다른 호출자에게는 영향 없음
+        result = await asyncio.shield(task)
+        return result.model_copy(deep=True)
+    
+    async def _scrape_and_cache(self, url: str, cache_key: str) -> ProductData:
         if not self._initialized:
             await self.initialize()
         
-        print(f"📄 크롤링 시작: {url}")
+        async with self._page_semaphore:
+            result = await self._scrape_page(url)
         
-        page = await self.context.new_page()
-        await stealth_async(page)
+        # 제목/이미지를 못 가져온 결과는 일시적 실패일 수 있으므로 캐시하지 않음
+        if self.cache_ttl > 0 and result.title != "제목 없음" and result.detail_images:
+            self._cache[cache_key] = (time.monotonic(), result)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+    
+    async def _scrape_page(self, url: str) -> ProductData:
+        logger.info("크롤링 시작: %s", url)
+        
+        page = await self._acquire_page()
+        reusable = False
         
         # 네트워크에서 이미지 URL 수집
-        network_images: set[str] = set()
+        # dict를 순서 있는 집합으로 사용 - 중복 없이 요청 순서(대체로 페이지 순서) 유지
+        # 이미지 본문은 쓰지 않으므로 응답 완료 대신 요청 시점에 URL만 기록
+        network_images: dict[str, None] = {}
         
-        def on_response(response: Response):
-            try:
-                resp_url = response.url
-                # Idus 이미지 CDN URL 수집
-                if 'image.idus.com' in resp_url:
-                    network_images.add(resp_url)
-                # 일반 이미지 리소스
-                elif response.request.resource_type == "image":
-                    if resp_url.startswith('http') and 'idus' in resp_url:
-                        network_images.add(resp_url)
-            except:
-                pass
+        def on_request(request: Request):
+            if len(network_images) >= _NETWORK_IMAGE_CAP:
+                return
+            req_url = request.url
+            # 대부분의 요청(스크립트/API/외부 도메인)은 부분 문자열 검사 한 번으로 바로 반환
+            if 'idus' not in req_url:
+                return
+            # Idus 이미지 CDN URL 또는 일반 이미지 리소스
+            if 'image.idus.com' in req_url or (
+                request.resource_type == "image" and req_url.startswith('http')
+            ):
+                network_images[req_url] = None
         
-        page.on("response", on_response)
+        page.on("request", on_request)
         
         try:
-            # 페이지 로드 (networkidle 대신 domcontentloaded + 대기)
+            # 페이지 로드 (networkidle 대신 domcontentloaded + 상품 영역 렌더링 대기)
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await asyncio.sleep(3)
-            
-            # HTML 전체 가져오기 (이미지 추출용)
-            html_content = await page.content()
+            try:
+                await page.wait_for_selector(
+                    'a[href*="/artist/"], [class*="price"]', state='attached', timeout=8000
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("상품 영역 대기 시간 초과 (계속 진행)")
             
-            # 1. 기본 정보 추출
-            title = await self._get_title(page)
-            artist_name = await self._get_artist(page)
-            price = await self._get_price(page)
-            description = await self._get_description(page)
-            options = await self._get_options(page)
+            # 1. 기본 정보 추출 (제목/작가/가격 + 설명 탭 클릭을 한 번의 왕복으로, 이후 탭 렌더링 대기 후 설명 읽기)
+            title, artist_name, price, tab_clicked = await self._get_basic_info(page)
+            # 설명 읽기와 옵션 추출은 동시에 진행 (클릭이 필요한 옵션 단계는 페이지 잠금으로 설명 읽기와 분리)
+            description, options = await asyncio.gather(
+                self._get_description(page, tab_clicked),
+                self._get_options(page),
+            )
             
             # 2. "작품 정보 더보기" 버튼 클릭하여 상세 정보 펼치기
-            print("📌 작품 정보 더보기 버튼 클릭 시도...")
+            logger.debug("작품 정보 더보기 버튼 클릭 시도")
             try:
-                expand_button = await page.query_selector('button:has-text("작품 정보 더보기")')
-                if expand_button:
-                    await expand_button.click()
-                    await asyncio.sleep(1)
-                    print("   ✅ 상세 정보 펼침")
-            except Exception as e:
-                print(f"   상세 정보 펼치기 실패 (무시): {e}")
-            
-            # 3. 전체 스크롤하여 lazy-load 이미지 로드
-            print("📜 이미지 로드를 위한 전체 스크롤...")
-            await self._full_scroll(page)
+                # 버튼 탐색/클릭을 페이지 안에서 한 번에 처리 (ElementHandle 왕복 없음)
+                expanded = await page.evaluate("""
+                    (label) => {
+                        for (const btn of document.querySelectorAll('button')) {
+                            if ((btn.textContent || '').includes(label)) {
+                                btn.click();
+                                return true;
+                            }
+                        }
+                        return false;
+                    }
+                """, '작품 정보 더보기')
+                if expanded:
+                    await self._wait_for_network_quiet(page)
+                    logger.debug("상세 정보 펼침")
+            except PlaywrightError as e:
+                logger.debug("상세 정보 펼치기 실패 (무시): %s", e)
             
-            # 스크롤 후 HTML 다시 가져오기
-            html_content = await page.content()
+            # 3. 상세페이지 영역 내 이미지 추출 (위치 정보 포함, Y좌표 정렬)
+            # 스크롤 필요 여부(lazy-load 대기, 상세 영역이 화면 아래까지 이어짐)도 같은 evaluate에서 함께 확인
+            logger.debug("상세페이지 이미지 추출 중")
+            detail_images_with_pos, needs_scroll = await self._extract_images_with_position(page)
             
-            # 4. 상세페이지 영역 내 이미지 추출 (위치 정보 포함, Y좌표 정렬)
-            print("📷 상세페이지 이미지 추출 중...")
-            detail_images_with_pos = await self._extract_images_with_position(page)
+            # 4. 스크롤이 필요하거나 이미지가 없을 때만 전체 스크롤 후 재추출
+            if needs_scroll or not detail_images_with_pos:
+                logger.debug("이미지 로드를 위한 전체 스크롤 후 재추출")
+                # 이미지가 있으면 상세 영역 끝이 보이고 lazy-load가 모두 끝나는 즉시 멈춤 (이미지가 없어서 스크롤할 때는 끝까지)
+                await self._full_scroll(page, stop_when_loaded=bool(detail_images_with_pos))
+                detail_images_with_pos, _ = await self._extract_images_with_position(page, click_tab=False)
+            else:
+                logger.debug("상세 영역이 화면 안에 있고 대기 중인 lazy-load 이미지 없음, 스크롤 생략")
             
             # 5. 위치 기반 이미지가 있으면 해당 결과 사용 (최소 1개 이상)
             if len(detail_images_with_pos) >= 1:
                 # 상세페이지 영역 이미지만 사용 (이미 Y좌표로 정렬됨)
                 filtered_images = [img['url'] for img in detail_images_with_pos]
                 filtered_images = self._filter_images(filtered_images)
-                print(f"   ✅ 상세페이지 영역 이미지 사용: {len(filtered_images)}개")
+                logger.debug("상세페이지 영역 이미지 사용: %d개", len(filtered_images))
             else:
                 # 폴백: 전체 이미지에서 추출 (DOM 경로 필터링 포함)
-                print("   ⚠️ 상세페이지 이미지 없음, 전체에서 추출 후 필터링...")
-                
-                all_images = set()
-                all_images.update(network_images)
+                logger.debug("상세페이지 이미지 없음, 전체에서 추출 후 필터링")
                 
                 # 폴백에서도 필터링 강화
-                filtered_images = self._filter_images_strict(list(all_images), page)
-                print(f"   네트워크에서 캡처 후 필터링: {len(network_images)}개 → {len(filtered_images)}개")
+                filtered_images = self._filter_images_strict(list(network_images), page)
+                logger.debug("네트워크에서 캡처 후 필터링: %d개 → %d개", len(network_images), len(filtered_images))
             
-            print(f"✅ 크롤링 완료: {title}")
-            print(f"   - 작가: {artist_name}")
-            print(f"   - 가격: {price}")
-            print(f"   - 옵션: {len(options)}개")
-            print(f"   - 최종 이미지: {len(filtered_images)}개")
+            logger.info(
+                "크롤링 완료: %s (작가: %s, 가격: %s, 옵션: %d개, 이미지: %d개)",
+                title, artist_name, price, len(options), len(filtered_images),
+            )
             
-            return ProductData(
+            result = ProductData(
                 url=url,
                 title=title,
                 artist_name=artist_name,
@@ -176,148 +627,313 @@ class IdusScraper:
                 detail_images=filtered_images,
                 image_texts=[]
             )
+            reusable = True
+            return result
             
         finally:
-            await page.close()
+            # 페이지는 풀에서 재사용되므로 리스너는 반드시 해제
+            page.remove_listener("request", on_request)
+            await self._release_page(page, reusable)
+    
+    async def _acquire_page(self) -> Page:
+        """유휴 페이지를 꺼내거나 새 페이지 생성 (stealth는 컨텍스트 단위로 적용됨)"""
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return await self._new_page()
+    
+    async def _new_page(self) -> Page:
+        """새 페이지 생성 - 페이지당 CDP 세션 하나로 HTTP 캐시 사용을 명시하고 불필요한 요청 차단
 
-    async def _get_title(self, page: Page) -> str:
+        page.route는 HTTP 캐시를 끄므로 사용하지 않음 (CDP를 쓸 수 없을 때만 대체 경로로 사용)
+        """
+        page = await self.context.new_page()
         try:
-            title = await page.title()
-            if title:
-                clean = title.replace(" | 아이디어스", "").strip()
-                if clean and len(clean) >= 3:
-                    return clean
-        except: pass
-        return "제목 없음"
-
-    async def _get_artist(self, page: Page) -> str:
-        """작가명 추출 - 여러 방법 시도"""
+            cdp = await self.context.new_cdp_session(page)
+            await cdp.send('Network.enable')
+            # 재사용 페이지/같은 도메인 재방문 시 JS/CSS 등 정적 자원을 캐시에서 읽도록 캐시 사용 명시
+            await cdp.send('Network.setCacheDisabled', {'cacheDisabled': False})
+            if self.block_resources:
+                async def resolve(params: dict):
+                    # 문서 요청은 가로채지 않으므로 프레임 구분 불필요
+                    blocked = _should_block_request(
+                        params.get('resourceType', '').lower(), params['request']['url'], False,
+                    )
+                    try:
+                        if blocked:
+                            await cdp.send('Fetch.failRequest', {
+                                'requestId': params['requestId'], 'errorReason': 'BlockedByClient',
+                            })
+                        else:
+                            await cdp.send('Fetch.continueRequest', {'requestId': params['requestId']})
+                    except PlaywrightError:
+                        pass  # 페이지가 닫히거나 이동하면서 이미 사라진 요청
+                
+                def on_paused(params: dict):
+                    # 응답 태스크 참조를 보관 (GC로 사라지면 요청이 일시정지된 채 남음)
+                    task = asyncio.ensure_future(resolve(params))
+                    self._fetch_tasks.add(task)
+                    task.add_done_callback(self._on_fetch_task_done)
+                
+                cdp.on('Fetch.requestPaused', on_paused)
+                await cdp.send('Fetch.enable', {'patterns': _BLOCKED_FETCH_PATTERNS})
+        except PlaywrightError as e:
+            # CDP를 쓸 수 없는 환경이면 기존 route 방식으로 대체
+            logger.debug("CDP 페이지 설정 실패: %s", e)
+            if self.block_resources:
+                await page.route("**/*", self._block_unneeded_resources)
+        return page
+    
+    def _on_fetch_task_done(self, task: asyncio.Task):
+        """Fetch 응답 태스크 정리 - 예외는 기록만 하고 전파하지 않음"""
+        self._fetch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("요청 가로채기 응답 실패: %s", task.exception())
+    
+    async def _release_page(self, page: Page, reusable: bool):
+        """정상 종료된 페이지는 빈 문서로 비워 재사용, 오류가 난 페이지는 닫기"""
+        if reusable and not page.is_closed():
+            try:
+                await page.goto('about:blank')
+                self._idle_pages.append(page)
+                return
+            except PlaywrightError as e:
+                logger.debug("페이지 재사용 준비 실패: %s", e)
         try:
-            # 방법 1: artist 링크에서 추출
-            result = await page.evaluate("""
-                () => {
-                    // artist 링크 찾기
-                    const artistLinks = document.querySelectorAll('a[href*="/artist/"]');
-                    for (const link of artistLinks) {
-                        const text = (link.innerText || '').trim();
-                        // 유효한 작가명인지 확인 (2~30자, 특수문자/UI텍스트 제외)
-                        if (text.length >= 2 && text.length <= 30) {
-                            if (!text.includes('바로가기') && !text.includes('작가') && 
-                                !text.includes('홈') && !text.includes('샵')) {
-                                return text;
+            await page.close()
+        except PlaywrightError:
+            pass
+
+    async def scrape_products(
+        self, urls: list[str], concurrency: Optional[int] = None
+    ) -> list[ProductData | BaseException]:
+        """여러 URL을 공유 컨텍스트에서 동시에 크롤링 (동시 페이지 수 제한)
+
+        결과는 urls 순서대로 반환되며, 실패한 URL 자리에는 예외 객체가 들어갑니다.
+        같은 상품을 가리키는 URL은 한 번만 크롤링해 동시 실행 슬롯을 차지하지 않습니다.
+        concurrency를 지정하지 않으면 페이지 풀 크기(max_pages)만큼 동시에 크롤링합니다.
+        동시 페이지 하나당 Chromium 메모리 80~150MB 정도를 기준으로 max_pages/concurrency를 정합니다.
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        # 페이지 풀이 이미 동시 페이지 수를 제한하므로 별도 제한은 더 낮게 잡고 싶을 때만 사용
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        
+        async def _scrape_one(url: str) -> ProductData:
+            if semaphore is None:
+                return await self.scrape_product(url)
+            async with semaphore:
+                return await self.scrape_product(url)
+        
+        # 정규화 키 → 대표 URL (처음 나온 URL로 크롤링)
+        unique: dict[str, str] = {}
+        for url in urls:
+            unique.setdefault(_normalize_product_url(url), url)
+        results = await asyncio.gather(*(_scrape_one(u) for u in unique.values()), return_exceptions=True)
+        by_key = dict(zip(unique, results))
+        
+        # 중복 URL은 같은 결과를 공유하지 않도록 복사본 반환 (예외는 그대로)
+        out: list[ProductData | BaseException] = []
+        used: set[str] = set()
+        for url in urls:
+            key = _normalize_product_url(url)
+            result = by_key[key]
+            if key in used and isinstance(result, ProductData):
+                result = result.model_copy(deep=True)
+            used.add(key)
+            out.append(result)
+        return out
+
+    def _prioritize_selectors(self, key: tuple[str, str], selectors: list[str]) -> list[str]:
+        """직전에 성공한 셀렉터를 맨 앞으로 - 같은 도메인에서는 대부분 첫 시도에 매칭"""
+        hot = self._hot_selectors.get(key)
+        if hot in selectors:
+            return [hot] + [s for s in selectors if s != hot]
+        return selectors
+
+    async def _get_basic_info(self, page: Page) -> tuple[str, str, str, bool]:
+        """제목/작가명/가격 추출과 작품정보 탭 클릭을 한 번의 evaluate로 처리 - 여러 방법 시도
+
+        반환값 마지막 항목은 설명 탭 클릭 여부 (설명 텍스트는 탭이 열린 뒤 _get_description에서 읽음)
+        """
+        hot_key = (urlparse(page.url).netloc, 'description_tab')
+        tab_labels = self._prioritize_selectors(hot_key, ['작품정보', '상품정보', '상세정보'])
+        info = {}
+        try:
+            info = await page.evaluate("""
+                (tabLabels) => {
+                    const findArtist = () => {
+                        // 방법 1: artist 링크에서 찾기
+                        const artistLinks = document.querySelectorAll('a[href*="/artist/"]');
+                        for (const link of artistLinks) {
+                            const text = (link.innerText || '').trim();
+                            // 유효한 작가명인지 확인 (2~30자, 특수문자/UI텍스트 제외)
+                            if (text.length >= 2 && text.length <= 30) {
+                                if (!text.includes('바로가기') && !text.includes('작가') && 
+                                    !text.includes('홈') && !text.includes('샵')) {
+                                    return text;
+                                }
                             }
                         }
-                    }
                     
-                    // 방법 2: 작가 관련 클래스에서 찾기
-                    const selectors = [
-                        '[class*="artist-name"]',
-                        '[class*="artistName"]', 
-                        '[class*="seller-name"]',
-                        '[class*="shop-name"]',
-                        '[class*="author"]'
-                    ];
-                    for (const sel of selectors) {
-                        const el = document.querySelector(sel);
-                        if (el) {
-                            const text = (el.innerText || '').trim();
-                            if (text.length >= 2 && text.length <= 30) {
-                                return text;
+                        // 방법 2: 작가 관련 클래스에서 찾기
+                        const selectors = [
+                            '[class*="artist-name"]',
+                            '[class*="artistName"]', 
+                            '[class*="seller-name"]',
+                            '[class*="shop-name"]',
+                            '[class*="author"]'
+                        ];
+                        for (const sel of selectors) {
+                            const el = document.querySelector(sel);
+                            if (el) {
+                                const text = (el.innerText || '').trim();
+                                if (text.length >= 2 && text.length <= 30) {
+                                    return text;
+                                }
                             }
                         }
-                    }
                     
-                    // 방법 3: meta 태그에서 찾기
-                    const metaAuthor = document.querySelector('meta[name="author"]');
-                    if (metaAuthor) {
-                        const content = metaAuthor.getAttribute('content');
-                        if (content && content.length >= 2) return content;
-                    }
+                        // 방법 3: meta 태그에서 찾기
+                        const metaAuthor = document.querySelector('meta[name="author"]');
+                        if (metaAuthor) {
+                            const content = metaAuthor.getAttribute('content');
+                            if (content && content.length >= 2) return content;
+                        }
                     
-                    return null;
-                }
-            """)
-            if result:
-                return result
-        except Exception as e:
-            print(f"작가명 추출 오류: {e}")
-        return "작가명 없음"
-
-    async def _get_price(self, page: Page) -> str:
-        """가격 추출 - 여러 방법 시도"""
-        try:
-            result = await page.evaluate("""
-                () => {
-                    // 방법 1: 가격 관련 클래스에서 찾기 (할인가 우선)
-                    const priceSelectors = [
-                        '[class*="sale-price"]',
-                        '[class*="salePrice"]',
-                        '[class*="final-price"]',
-                        '[class*="finalPrice"]',
-                        '[class*="discount-price"]',
-                        '[class*="price"]'
-                    ];
+                        return null;
+                    };
+                    
+                    const findPrice = () => {
+                        // 방법 1: 가격 관련 클래스에서 찾기 (할인가 우선)
+                        const priceSelectors = [
+                            '[class*="sale-price"]',
+                            '[class*="salePrice"]',
+                            '[class*="final-price"]',
+                            '[class*="finalPrice"]',
+                            '[class*="discount-price"]',
+                            '[class*="price"]'
+                        ];
                     
-                    for (const sel of priceSelectors) {
-                        const els = document.querySelectorAll(sel);
-                        for (const el of els) {
-                            const text = el.innerText || '';
+                        // 한 번의 순회로 우선순위가 가장 높은 후보만 유지 (같은 순위는 문서 순서 우선)
+                        let best = null;
+                        let bestRank = priceSelectors.length;
+                        for (const el of document.querySelectorAll(priceSelectors.join(', '))) {
+                            const rank = priceSelectors.findIndex(sel => el.matches(sel));
+                            if (rank >= bestRank) continue;
                             // 숫자,원 패턴 매칭 (최소 3자리 이상)
-                            const match = text.match(/([\\d,]{3,})\\s*원/);
+                            const match = (el.innerText || '').match(/([\\d,]{3,})\\s*원/);
                             if (match) {
-                                return match[0];
+                                best = match[0];
+                                bestRank = rank;
+                                if (rank === 0) break;
                             }
                         }
-                    }
+                        if (best) return best;
                     
-                    // 방법 2: 전체 페이지에서 첫 번째 가격 패턴 찾기
-                    const allText = document.body.innerText || '';
-                    const priceMatch = allText.match(/([\\d,]{4,})\\s*원/);
-                    if (priceMatch) {
-                        return priceMatch[0];
-                    }
+                        // 방법 2: 전체 페이지에서 첫 번째 가격 패턴 찾기
+                        const allText = document.body.innerText || '';
+                        const priceMatch = allText.match(/([\\d,]{4,})\\s*원/);
+                        if (priceMatch) {
+                            return priceMatch[0];
+                        }
+                    
+                        return null;
+                    };
                     
-                    return null;
+                    // 작품정보 탭 클릭 (기본 정보를 먼저 읽은 뒤 클릭하므로 읽기 결과에 영향 없음)
+                    const clickTab = () => {
+                        // 탭 형태 요소와 탭 목록/nav 안의 요소만 검사 (일반 블록 전체를 훑지 않음), 중첩되면 가장 안쪽 요소를 클릭
+                        const els = document.querySelectorAll(
+                            '[role="tab"], button, a, li, [role="tablist"] *, nav *'
+                        );
+                        for (const label of tabLabels) {
+                            let target = null;
+                            for (const el of els) {
+                                if ((el.textContent || '').trim() !== label) continue;
+                                const rect = el.getBoundingClientRect();
+                                if (!rect.width || !rect.height) continue;
+                                if (target && !target.contains(el)) break;
+                                target = el;
+                            }
+                            if (target) {
+                                target.click();
+                                return label;
+                            }
+                        }
+                        return null;
+                    };
+                    
+                    const info = { title: document.title, artist: findArtist(), price: findPrice() };
+                    info.tab = clickTab();
+                    return info;
                 }
-            """)
-            if result:
-                return result
-        except Exception as e:
-            print(f"가격 추출 오류: {e}")
-        return "가격 정보 없음"
+            """, tab_labels) or {}
+        except PlaywrightError as e:
+            logger.warning("기본 정보 추출 오류: %s", e)
+        
+        if info.get('tab'):
+            self._hot_selectors[hot_key] = info['tab']
+        title = (info.get('title') or '').replace(" | 아이디어스", "").strip()
+        if len(title) < 3:
+            title = "제목 없음"
+        return (
+            title,
+            info.get('artist') or "작가명 없음",
+            info.get('price') or "가격 정보 없음",
+            bool(info.get('tab')),
+        )
 
-    async def _get_description(self, page: Page) -> str:
-        # 작품정보 탭 클릭 시도
-        try:
-            for sel in ['text="작품정보"', 'text="상품정보"', 'text="상세정보"']:
-                tab = await page.query_selector(sel)
-                if tab:
-                    await tab.click()
-                    await asyncio.sleep(1)
-                    break
-        except: pass
+    def _page_lock(self, page: Page) -> asyncio.Lock:
+        """페이지별 화면 상태 잠금 (없으면 생성, 페이지가 사라지면 함께 정리됨)"""
+        lock = self._page_locks.get(page)
+        if lock is None:
+            lock = self._page_locks[page] = asyncio.Lock()
+        return lock
+
+    async def _get_description(self, page: Page, tab_clicked: bool) -> str:
+        """작품 설명 텍스트 추출 - 탭은 _get_basic_info에서 이미 클릭됨
+
+        옵션 패널이 열린 상태를 읽지 않도록 페이지 잠금 안에서 읽음 (옵션 추출보다 먼저 시작하면 먼저 잠금을 얻음)
+        """
+        async with self._page_lock(page):
+            return await self._read_description(page, tab_clicked)
+
+    async def _read_description(self, page: Page, tab_clicked: bool) -> str:
+        """설명 탭 패널 렌더링을 기다린 뒤 가장 긴 본문 텍스트를 읽음"""
+        if tab_clicked:
+            await self._wait_for_tab_panel(page)
         
         try:
             text = await page.evaluate("""
-                () => {
-                    const selectors = ['article', '[class*="detail"]', '[class*="description"]', '[class*="content"]', 'main'];
+                (maxLength) => {
+                    // 셀렉터 그룹 하나로 조회 - 여러 셀렉터에 걸리는 요소도 innerText는 한 번만 계산
+                    const els = document.querySelectorAll(
+                        'article, [class*="detail"], [class*="description"], [class*="content"], main'
+                    );
                     let longest = '';
-                    for (const sel of selectors) {
-                        document.querySelectorAll(sel).forEach(el => {
-                            const t = el.innerText || '';
-                            if (t.length > longest.length && t.length > 100) {
-                                if (!t.includes('로그인') && !t.includes('장바구니')) {
-                                    longest = t;
-                                }
+                    let longestEl = null;
+                    for (const el of els) {
+                        // 현재 채택된 요소의 하위 요소는 텍스트가 더 길 수 없으므로 innerText 계산 생략
+                        // (querySelectorAll은 문서 순서라 조상이 먼저 나옴)
+                        if (longestEl && longestEl.contains(el)) continue;
+                        const t = el.innerText || '';
+                        if (t.length > longest.length && t.length > 100) {
+                            if (!t.includes('로그인') && !t.includes('장바구니')) {
+                                longest = t;
+                                longestEl = el;
                             }
-                        });
+                        }
                     }
-                    return longest || null;
+                    // 사용할 길이만큼만 잘라서 반환 (CDP로 넘기는 문자열 크기 축소)
+                    return longest ? longest.slice(0, maxLength) : null;
                 }
-            """)
+            """, _DESCRIPTION_MAX_CHARS)
             if text:
-                return text[:6000]
-        except: pass
+                return text
+        except PlaywrightError: pass
         return "설명 없음"
 
     async def _get_options(self, page: Page) -> list[ProductOption]:
@@ -325,265 +941,140 @@ class IdusScraper:
         options: list[ProductOption] = []
         
         try:
-            print("   📌 계층형 옵션 추출 시작...")
+            logger.debug("계층형 옵션 추출 시작")
             
             # 1단계: 옵션 영역 찾기 및 클릭
-            option_area_selectors = [
-                'text="옵션을 선택해주세요"',
-                'text="옵션 선택"',
-                '[class*="option-select"]',
-                '[class*="optionSelect"]',
-                'button:has-text("옵션")',
-            ]
-            
+            # 후보 셀렉터를 동시에 조회하고 (왕복 지연 한 번) 우선순위 순으로 첫 매칭 사용
+            # 가시성 판정은 셀렉터 안에서 처리 (is_visible 왕복 없음)
+            # 열린 옵션 패널 확인도 같은 묶음에서 함께 조회 (클릭 전 별도 왕복 없음)
             option_area = None
-            for selector in option_area_selectors:
-                try:
-                    option_area = await page.query_selector(selector)
-                    if option_area and await option_area.is_visible():
-                        print(f"      옵션 영역 발견: {selector}")
-                        break
-                    option_area = None
-                except:
-                    continue
+            hot_key = (urlparse(page.url).netloc, 'option_area')
+            candidates = self._prioritize_selectors(hot_key, list(_OPTION_AREA_SELECTORS))
+            open_panel, *matches = await asyncio.gather(
+                page.query_selector(_OPTION_PANEL_SELECTOR),
+                *(page.query_selector(f'{selector} >> visible=true') for selector in candidates),
+                return_exceptions=True,
+            )
+            for selector, match in zip(candidates, matches):
+                if match and not isinstance(match, BaseException):
+                    option_area = match
+                    logger.debug("옵션 영역 발견: %s", selector)
+                    self._hot_selectors[hot_key] = selector
+                    break
             
             if not option_area:
-                print("      ⚠️ 옵션 영역을 찾을 수 없음, 후기에서 추출 시도...")
+                logger.debug("옵션 영역을 찾을 수 없음, 후기에서 추출 시도")
                 return await self._get_options_from_reviews(page)
             
-            # 2단계: 옵션 영역 클릭하여 옵션 패널 열기
-            await option_area.click()
-            await asyncio.sleep(1)
+            # 2~6단계는 패널을 열고 클릭하므로 페이지 잠금 안에서 진행 (동시에 실행되는 설명 읽기와 섞이지 않도록)
+            async with self._page_lock(page):
+                # 2단계: 패널이 닫혀 있을 때만 옵션 영역 클릭, 고정 대기 대신 패널 렌더링 대기
+                if not open_panel or isinstance(open_panel, BaseException):
+                    await option_area.click()
+                    try:
+                        await page.wait_for_selector(_OPTION_PANEL_SELECTOR, timeout=1000)
+                    except PlaywrightTimeoutError:
+                        logger.debug("옵션 패널 대기 시간 초과 (계속 진행)")
             
-            # 3단계: 옵션 그룹 개수 파악 (옵션 선택 (0/2) 형태)
-            option_info = await page.evaluate("""
-                () => {
-                    // "옵션 선택 (0/2)" 또는 "옵션 선택(0/2)" 형태에서 총 옵션 그룹 수 추출
-                    const allText = document.body.innerText || '';
-                    const match = allText.match(/옵션\\s*선택\\s*\\(?\\s*(\\d+)\\s*\\/\\s*(\\d+)\\s*\\)?/);
-                    if (match) {
-                        return { current: parseInt(match[1]), total: parseInt(match[2]) };
+                # 3단계: 옵션 그룹 개수 파악 (옵션 선택 (0/2) 형태)
+                option_info = await page.evaluate("""
+                    () => {
+                        // "옵션 선택 (0/2)" 또는 "옵션 선택(0/2)" 형태에서 총 옵션 그룹 수 추출
+                        const allText = document.body.innerText || '';
+                        const match = allText.match(/옵션\\s*선택\\s*\\(?\\s*(\\d+)\\s*\\/\\s*(\\d+)\\s*\\)?/);
+                        if (match) {
+                            return { current: parseInt(match[1]), total: parseInt(match[2]) };
+                        }
+                        return null;
                     }
-                    return null;
-                }
-            """)
+                """)
             
-            total_groups = option_info['total'] if option_info else 1
-            print(f"      옵션 그룹 수: {total_groups}개")
+                total_groups = option_info['total'] if option_info else 1
+                logger.debug("옵션 그룹 수: %d개", total_groups)
             
-            # 4단계: 각 옵션 그룹을 순차적으로 클릭하여 옵션값 추출
-            for group_idx in range(1, total_groups + 1):
-                print(f"      📍 {group_idx}번 옵션 그룹 처리 중...")
+                # 4단계: 각 옵션 그룹을 순차적으로 클릭하여 옵션값 추출
+                seen_names: set[str] = set()
+                for group_idx in range(1, total_groups + 1):
+                    logger.debug("%d번 옵션 그룹 처리 중", group_idx)
                 
-                # 옵션 그룹 헤더 찾기 ("1. 핫케이크 높이" 형태)
-                js_find_group = """
-                    (groupIdx) => {
-                        const result = { name: null, values: [], headerElement: null };
-                        
-                        // 옵션 그룹 헤더 찾기 (아코디언/드롭다운 형태)
-                        const allElements = document.querySelectorAll('*');
-                        let foundHeader = null;
-                        let groupName = null;
-                        
-                        for (const el of allElements) {
-                            const text = (el.innerText || el.textContent || '').trim();
-                            
-                            // "1. 핫케이크 높이" 또는 "1. 기타 옵션" 형태
-                            const headerMatch = text.match(new RegExp('^' + groupIdx + '\\\\.\\\\s*(.+?)(?:\\\\s|$)'));
-                            if (headerMatch && text.length < 50) {
-                                // 클릭 가능한 요소인지 확인
-                                const rect = el.getBoundingClientRect();
-                                if (rect.width > 50 && rect.height > 20) {
-                                    groupName = headerMatch[1].trim();
-                                    foundHeader = el;
-                                    break;
-                                }
-                            }
-                        }
-                        
-                        if (groupName) {
-                            result.name = groupName;
-                            
-                            // 해당 그룹의 옵션값 찾기
-                            // 헤더 다음에 오는 옵션 리스트 탐색
-                            if (foundHeader) {
-                                let sibling = foundHeader.nextElementSibling;
-                                let parent = foundHeader.parentElement;
-                                
-                                // 같은 부모 내에서 옵션값 찾기
-                                const searchContainer = parent || document.body;
-                                const options = searchContainer.querySelectorAll(
-                                    '[role="option"], [class*="option-item"], [class*="optionItem"], ' +
-                                    'li, [class*="select-item"], [class*="selectItem"]'
-                                );
-                                
-                                options.forEach(opt => {
-                                    const optText = (opt.innerText || '').trim().split('\\n')[0].trim();
-                                    
-                                    // 유효한 옵션값인지 확인
-                                    if (optText && optText.length >= 1 && optText.length <= 60) {
-                                        const noise = ['선택해주세요', '선택하세요', '확인', '취소', 
-                                                      '닫기', '장바구니', '구매하기', '필수', '옵션'];
-                                        const isNoise = noise.some(n => optText.includes(n));
-                                        const isGroupHeader = /^\\d+\\./.test(optText);
-                                        const isPriceOnly = /^[\\d,]+\\s*원?$/.test(optText);
-                                        
-                                        if (!isNoise && !isGroupHeader && !isPriceOnly) {
-                                            // 가격 정보 제거
-                                            let cleanValue = optText.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
-                                            if (cleanValue.length >= 1 && !result.values.includes(cleanValue)) {
-                                                result.values.push(cleanValue);
-                                            }
-                                        }
-                                    }
-                                });
-                            }
-                        }
-                        
-                        return result;
-                    }
-                """
-                group_data = await page.evaluate(js_find_group, group_idx)
+                    # 옵션 그룹 헤더 찾기 + 클릭 ("1. 핫케이크 높이" 형태)
+                    group_data = await page.evaluate(
+                        "(groupIdx) => window.__idusScraper.findOptionGroup(groupIdx)", group_idx
+                    )
                 
-                # 그룹 헤더를 직접 클릭하여 옵션 펼치기
-                if group_data and group_data.get('name'):
-                    group_name = group_data['name']
+                    if group_data and group_data.get('name'):
+                        group_name = group_data['name']
                     
-                    # 그룹 헤더 클릭 (아코디언 펼치기)
-                    try:
-                        header_selector = f'text="{group_idx}. {group_name}"'
-                        header_el = await page.query_selector(header_selector)
-                        if header_el:
-                            await header_el.click()
-                            await asyncio.sleep(0.5)
-                    except:
-                        pass
-                    
-                    # 펼쳐진 후 옵션값 다시 추출
-                    # group_name을 안전하게 이스케이프
-                    safe_group_name = group_name.replace('\\', '\\\\').replace('"', '\\"') if group_name else ''
+                        # 펼쳐진 후 옵션값 다시 추출
+                        # group_name을 안전하게 이스케이프
+                        safe_group_name = group_name.replace('\\', '\\\\').replace('"', '\\"') if group_name else ''
+                        group_args = {'groupIdx': group_idx, 'groupName': safe_group_name}
                     
-                    js_code = """
-                        (args) => {
-                            const values = [];
-                            const groupIdx = args.groupIdx;
-                            const groupName = args.groupName;
-                            
-                            // 화면에 보이는 모든 텍스트에서 옵션값 패턴 찾기
-                            // 특히 아코디언/드롭다운이 펼쳐진 상태에서
-                            
-                            // 방법 1: role="option" 또는 li 요소
-                            const optionElements = document.querySelectorAll(
-                                '[role="option"], [role="listitem"], ' +
-                                '[class*="option-item"], [class*="optionItem"], ' +
-                                '[class*="select-item"], [class*="selectItem"], ' +
-                                '[class*="dropdown-item"], [class*="dropdownItem"]'
-                            );
-                            
-                            optionElements.forEach(el => {
-                                const rect = el.getBoundingClientRect();
-                                // 화면에 보이는 요소만
-                                if (rect.width > 0 && rect.height > 0) {
-                                    const text = (el.innerText || '').trim().split('\\n')[0].trim();
-                                    
-                                    if (text && text.length >= 1 && text.length <= 60) {
-                                        const noise = ['선택해', '확인', '취소', '닫기', '필수', '옵션 선택'];
-                                        const isNoise = noise.some(n => text.includes(n));
-                                        const isGroupHeader = /^\\d+\\./.test(text);
-                                        const isPriceOnly = /^[\\d,]+\\s*원?$/.test(text);
-                                        
-                                        if (!isNoise && !isGroupHeader && !isPriceOnly) {
-                                            let cleanValue = text.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
-                                            if (cleanValue.length >= 1 && !values.includes(cleanValue)) {
-                                                values.push(cleanValue);
-                                            }
-                                        }
-                                    }
-                                }
-                            });
-                            
-                            // 방법 2: 그룹 헤더 아래의 텍스트 라인들
-                            if (values.length === 0) {
-                                const allText = document.body.innerText || '';
-                                const lines = allText.split('\\n');
-                                let inGroup = false;
-                                
-                                for (let i = 0; i < lines.length; i++) {
-                                    const line = lines[i].trim();
-                                    
-                                    // 현재 그룹 헤더 발견
-                                    if (line.startsWith(groupIdx + '.') || line.includes(groupName)) {
-                                        inGroup = true;
-                                        continue;
-                                    }
-                                    
-                                    // 다음 그룹 헤더 발견 시 종료
-                                    if (inGroup && /^\\d+\\./.test(line)) {
-                                        break;
-                                    }
-                                    
-                                    // 옵션값 수집
-                                    if (inGroup && line.length >= 1 && line.length <= 60) {
-                                        const noise = ['선택해', '확인', '취소', '닫기', '필수', '옵션'];
-                                        const isNoise = noise.some(n => line.includes(n));
-                                        const isPriceOnly = /^[\\d,]+\\s*원?$/.test(line);
-                                        
-                                        if (!isNoise && !isPriceOnly && !/^\\d+\\./.test(line)) {
-                                            let cleanValue = line.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
-                                            if (cleanValue.length >= 1 && !values.includes(cleanValue)) {
-                                                values.push(cleanValue);
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            return values;
-                        }
-                    """
-                    expanded_values = await page.evaluate(js_code, {'groupIdx': group_idx, 'groupName': safe_group_name})
+                        # 그룹 헤더는 findOptionGroup 안에서 이미 클릭됨 (아코디언 펼치기)
+                        # 고정 대기 대신 클릭 전과 다른 옵션값이 렌더링되는 즉시 읽음 (최대 0.5초, 대기와 조회를 한 번에)
+                        expanded_values = None
+                        if group_data.get('clicked'):
+                            try:
+                                handle = await page.wait_for_function(
+                                    """(args) => {
+                                        const values = window.__idusScraper.collectGroupValues(args);
+                                        if (!values || !values.length) return null;
+                                        return JSON.stringify(values) !== JSON.stringify(args.valuesBefore) ? values : null;
+                                    }""",
+                                    arg={**group_args, 'valuesBefore': group_data.get('valuesBefore') or []},
+                                    timeout=500
+                                )
+                                expanded_values = await handle.json_value()
+                            except PlaywrightTimeoutError:
+                                pass
+                        if not expanded_values:
+                            expanded_values = await page.evaluate(
+                                "(args) => window.__idusScraper.collectGroupValues(args)", group_args
+                            )
                     
-                    final_values = expanded_values if expanded_values else group_data.get('values', [])
+                        final_values = expanded_values if expanded_values else group_data.get('values', [])
                     
-                    if final_values:
-                        options.append(ProductOption(name=group_name, values=final_values))
-                        print(f"         ✅ {group_name}: {final_values}")
+                        if final_values:
+                            if group_name in seen_names:
+                                logger.debug("같은 이름의 옵션 그룹 재등장: %s", group_name)
+                            seen_names.add(group_name)
+                            options.append(ProductOption(name=group_name, values=final_values))
+                            logger.debug("옵션 그룹 추출: %s: %s", group_name, final_values)
                         
-                        # 다음 옵션 그룹 활성화를 위해 첫 번째 옵션 선택
-                        if group_idx < total_groups and len(final_values) > 0:
-                            try:
-                                first_option = final_values[0]
-                                option_selector = f'text="{first_option}"'
-                                option_el = await page.query_selector(option_selector)
-                                if option_el and await option_el.is_visible():
-                                    await option_el.click()
-                                    await asyncio.sleep(0.5)
-                                    print(f"         → 다음 그룹 활성화를 위해 '{first_option}' 선택")
-                            except:
-                                pass
+                            # 다음 옵션 그룹 활성화를 위해 첫 번째 옵션 선택
+                            if group_idx < total_groups and len(final_values) > 0:
+                                try:
+                                    first_option = final_values[0]
+                                    option_selector = f'text="{first_option}"'
+                                    option_el = await page.query_selector(f'{option_selector} >> visible=true')
+                                    if option_el:
+                                        await option_el.click()
+                                        await asyncio.sleep(0.5)
+                                        logger.debug("다음 그룹 활성화를 위해 '%s' 선택", first_option)
+                                except PlaywrightError:
+                                    pass
             
-            # 5단계: 결과가 없으면 대체 방법 시도
-            if not options:
-                print("      ⚠️ 계층형 옵션 추출 실패, 단순 패널 추출 시도...")
-                options = await self._get_options_simple(page)
+                # 5단계: 결과가 없으면 대체 방법 시도
+                if not options:
+                    logger.debug("계층형 옵션 추출 실패, 단순 패널 추출 시도")
+                    options = await self._get_options_simple(page)
             
-            # 6단계: 여전히 없으면 후기에서 추출
-            if not options:
-                print("      ⚠️ 패널 추출 실패, 후기에서 추출 시도...")
-                options = await self._get_options_from_reviews(page)
+                # 6단계: 여전히 없으면 후기에서 추출
+                if not options:
+                    logger.debug("패널 추출 실패, 후기에서 추출 시도")
+                    options = await self._get_options_from_reviews(page)
             
-            # 패널 닫기
-            await page.keyboard.press("Escape")
-            await asyncio.sleep(0.3)
+                # 패널 닫기 - 고정 대기 대신 패널이 사라지는 즉시 진행 (최대 0.3초)
+                await page.keyboard.press("Escape")
+                try:
+                    await page.wait_for_selector(_OPTION_PANEL_SELECTOR, state='hidden', timeout=300)
+                except PlaywrightTimeoutError:
+                    pass
             
-            print(f"   📌 옵션 추출 완료: {len(options)}개 그룹")
-            for opt in options:
-                print(f"      - {opt.name}: {opt.values}")
+            logger.debug("옵션 추출 완료: %d개 그룹 %s", len(options), options)
             
         except Exception as e:
-            print(f"옵션 추출 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("옵션 추출 오류: %s", e)
         
         return options
     
@@ -604,9 +1095,13 @@ class IdusScraper:
                         '[class*="modal"], [class*="drawer"]'
                     );
                     
+                    const visited = [];
                     for (const panel of panels) {
+                        // 이미 처리한 패널 안에 중첩된 패널은 다시 파싱하지 않음
+                        if (visited.some(p => p.contains(panel))) continue;
                         const rect = panel.getBoundingClientRect();
                         if (rect.width < 50 || rect.height < 50) continue;
+                        visited.push(panel);
                         
                         const allText = panel.innerText || '';
                         const lines = allText.split('\\n');
@@ -625,7 +1120,7 @@ class IdusScraper:
                                     !['선택해주세요', '확인', '취소', '닫기'].some(n => potentialGroup.includes(n))) {
                                     currentGroup = potentialGroup;
                                     if (!optionGroups[currentGroup]) {
-                                        optionGroups[currentGroup] = [];
+                                        optionGroups[currentGroup] = new Set();
                                     }
                                     continue;
                                 }
@@ -639,8 +1134,8 @@ class IdusScraper:
                                 
                                 if (!isNoise && !isPriceOnly && !/^\\d+\\./.test(trimmed)) {
                                     let cleanValue = trimmed.replace(/\\s*\\(?[\\+\\-]?[\\d,]+\\s*원\\)?\\s*$/g, '').trim();
-                                    if (cleanValue.length >= 1 && !optionGroups[currentGroup].includes(cleanValue)) {
-                                        optionGroups[currentGroup].push(cleanValue);
+                                    if (cleanValue.length >= 1) {
+                                        optionGroups[currentGroup].add(cleanValue);
                                     }
                                 }
                             }
@@ -648,8 +1143,8 @@ class IdusScraper:
                     }
                     
                     for (const [name, values] of Object.entries(optionGroups)) {
-                        if (values.length > 0) {
-                            result.push({ name, values: [...new Set(values)] });
+                        if (values.size > 0) {
+                            result.push({ name, values: Array.from(values) });
                         }
                     }
                     
@@ -657,13 +1152,14 @@ class IdusScraper:
                 }
             """)
             
-            if panel_options:
-                for opt in panel_options:
-                    if opt.get('values') and len(opt['values']) > 0:
-                        options.append(ProductOption(name=opt['name'], values=opt['values']))
+            options = [
+                ProductOption(name=opt['name'], values=opt['values'])
+                for opt in panel_options or []
+                if opt.get('values')
+            ]
                         
-        except Exception as e:
-            print(f"단순 옵션 추출 오류: {e}")
+        except PlaywrightError as e:
+            logger.warning("단순 옵션 추출 오류: %s", e)
         
         return options
     
@@ -673,41 +1169,62 @@ class IdusScraper:
         try:
             review_options = await page.evaluate("""
                 () => {
-                    const optionGroups = {};
-                    const allText = document.body.innerText || '';
+                    // 페이지 전체 innerText 대신 콜론이 들어 있는 텍스트 노드의 부모 요소만 읽음
+                    // (TreeWalker로 텍스트 노드만 훑고, 이미 읽은 요소 안쪽 요소는 중복으로 읽지 않음)
+                    const collectText = (roots) => {
+                        const texts = [];
+                        for (const root of roots) {
+                            const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+                                acceptNode: n => (n.nodeValue.includes(':') || n.nodeValue.includes('：'))
+                                    ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT
+                            });
+                            let lastEl = null;
+                            while (walker.nextNode()) {
+                                const parent = walker.currentNode.parentElement;
+                                if (!parent || ['SCRIPT', 'STYLE', 'NOSCRIPT'].includes(parent.tagName)) continue;
+                                // "<span>색상:</span><span>빨강</span>"처럼 값이 형제 요소에 있을 수 있으므로
+                                // 콜론 노드의 부모 대신 가장 가까운 블록/후기 항목 요소 전체를 읽음 (후기 영역 밖으로는 나가지 않음)
+                                let el = parent.closest('[class*="review-item" i], [class*="reviewItem" i], li, p, dd, td, div') || parent;
+                                if (!root.contains(el)) el = parent;
+                                if (el === lastEl || (lastEl && lastEl.contains(el))) continue;
+                                lastEl = el;
+                                texts.push(el.innerText || '');
+                            }
+                        }
+                        return texts.join('\\n');
+                    };
                     
                     // 패턴: "옵션명: 옵션값" 또는 "옵션명 선택: 옵션값"
-                    const patterns = [
-                        /([가-힣a-zA-Z]+(?:\\s*선택)?)\\s*[：:]\\s*([가-힣a-zA-Z0-9\\s\\(\\)\\[\\]]+?)(?=\\s*\\*|\\s*[,\\n]|$)/g
-                    ];
+                    const optionRe = /([가-힣a-zA-Z]+(?:\\s*선택)?)\\s*[：:]\\s*([가-힣a-zA-Z0-9\\s\\(\\)\\[\\]]+?)(?=\\s*\\*|\\s*[,\\n]|$)/g;
+                    // 옵션명이 아닌 구매/배송 정보 라벨 (단어 목록을 매치마다 순회하지 않고 정규식 한 번으로 검사)
+                    const blockedNameRe = /구매|배송|결제|가격/;
                     
-                    for (const pattern of patterns) {
-                        const matches = allText.matchAll(pattern);
-                        for (const match of matches) {
-                            let optName = match[1].trim();
-                            let optValue = match[2].trim().replace(/\\s+/g, ' ');
+                    // 정규식 한 번의 matchAll로 텍스트 전체를 훑어 옵션명 → 옵션값 집합으로 묶음
+                    const parseGroups = (allText) => {
+                        const optionGroups = new Map();
+                        for (const match of allText.matchAll(optionRe)) {
+                            const optName = match[1].trim();
+                            const optValue = match[2].trim().replace(/\\s+/g, ' ');
                             
                             // 유효성 검사
-                            if (optName && optValue &&
-                                optName.length >= 2 && optName.length <= 30 && 
+                            if (optName.length >= 2 && optName.length <= 30 &&
                                 optValue.length >= 1 && optValue.length <= 80 &&
-                                !['구매', '배송', '결제', '가격'].some(n => optName.includes(n))) {
-                                
-                                if (!optionGroups[optName]) {
-                                    optionGroups[optName] = new Set();
-                                }
-                                optionGroups[optName].add(optValue);
+                                !blockedNameRe.test(optName)) {
+                                if (!optionGroups.has(optName)) optionGroups.set(optName, new Set());
+                                optionGroups.get(optName).add(optValue);
                             }
                         }
-                    }
+                        return Array.from(optionGroups, ([name, values]) => ({ name, values: Array.from(values) }));
+                    };
                     
-                    const result = [];
-                    for (const [name, values] of Object.entries(optionGroups)) {
-                        if (values.size > 0) {
-                            result.push({ name, values: Array.from(values) });
-                        }
+                    // 후기 영역(가장 바깥 review 컨테이너)만 먼저 훑고, 못 찾으면 body 전체로 대체
+                    const reviewRoots = Array.from(document.querySelectorAll('[class*="review" i]'))
+                        .filter(el => !el.parentElement?.closest('[class*="review" i]'));
+                    if (reviewRoots.length > 0) {
+                        const scoped = parseGroups(collectText(reviewRoots));
+                        if (scoped.length > 0) return scoped;
                     }
-                    return result;
+                    return parseGroups(collectText([document.body]));
                 }
             """)
             
@@ -715,185 +1232,154 @@ class IdusScraper:
                 for opt in review_options:
                     if opt.get('values') and len(opt['values']) > 0:
                         options.append(ProductOption(name=opt['name'], values=opt['values']))
-                        print(f"      ✅ 후기에서 추출: {opt['name']}: {opt['values']}")
+                        logger.debug("후기에서 추출: %s: %s", opt['name'], opt['values'])
                         
-        except Exception as e:
-            print(f"후기 옵션 추출 오류: {e}")
+        except PlaywrightError as e:
+            logger.warning("후기 옵션 추출 오류: %s", e)
         
         return options
 
-    async def _full_scroll(self, page: Page):
-        """페이지 전체를 천천히 스크롤"""
+    async def _wait_for_tab_panel(self, page: Page, timeout: int = 1000):
+        """탭 클릭 후 고정 1초 대기 대신 보이는 탭 패널에 내용이 채워지는 즉시 진행 (최대 timeout ms)"""
         try:
-            total = await page.evaluate("document.body.scrollHeight")
-            current = 0
-            step = 400
-            
-            while current < total:
-                await page.evaluate(f"window.scrollTo(0, {current})")
-                await asyncio.sleep(0.3)
-                current += step
-                new_total = await page.evaluate("document.body.scrollHeight")
-                if new_total > total:
-                    total = new_total
-            
-            # 마지막에 맨 아래까지 확실히 스크롤
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1.5)
-            
-        except Exception as e:
-            print(f"스크롤 오류: {e}")
+            await page.wait_for_function("""
+                () => Array.from(document.querySelectorAll('[role="tabpanel"]')).some(panel =>
+                    !panel.hidden && panel.offsetHeight > 0 &&
+                    ((panel.innerText || '').length > 50 || panel.querySelector('img'))
+                )
+            """, timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
 
-    def _extract_images_from_html(self, html: str) -> set[str]:
-        """HTML 전체에서 정규식으로 이미지 URL 추출"""
-        images = set()
-        
-        # 1. image.idus.com 패턴 (가장 중요)
-        idus_pattern = r'https?://image\.idus\.com/image/files/[a-f0-9]+(?:_\d+)?\.(?:jpg|jpeg|png|webp|gif)'
-        for match in re.findall(idus_pattern, html, re.IGNORECASE):
-            images.add(match)
-        
-        # 2. 더 유연한 패턴 (확장자 없는 경우도 포함)
-        idus_pattern2 = r'https?://image\.idus\.com/image/files/[a-f0-9_]+(?:\.[a-z]{3,4})?'
-        for match in re.findall(idus_pattern2, html, re.IGNORECASE):
-            if len(match) > 40:  # 충분히 긴 URL만
-                images.add(match)
-        
-        # 3. cdn.idus.kr 패턴
-        cdn_pattern = r'https?://cdn\.idus\.kr[^"\'\s\)>]+\.(?:jpg|jpeg|png|webp|gif)'
-        for match in re.findall(cdn_pattern, html, re.IGNORECASE):
-            images.add(match)
-        
-        # 4. 일반 이미지 URL (idus 도메인만)
-        general_pattern = r'https?://[^"\'\s\)>]*idus[^"\'\s\)>]*\.(?:jpg|jpeg|png|webp|gif)'
-        for match in re.findall(general_pattern, html, re.IGNORECASE):
-            images.add(match)
-        
-        return images
-    
-    def _extract_images_from_nuxt(self, html: str) -> set[str]:
-        """__NUXT__ 스크립트에서 이미지 URL 추출"""
-        images = set()
-        
+    async def _wait_for_network_quiet(self, page: Page, quiet: float = 0.3, timeout: float = 1.0):
+        """진행 중인 요청 없이 quiet초가 지날 때까지 대기 (최대 timeout초) - 클릭 후 고정 sleep 대체"""
+        pending = set()
+        handlers = {
+            "request": pending.add,
+            "requestfinished": pending.discard,
+            "requestfailed": pending.discard,
+        }
+        for event, handler in handlers.items():
+            page.on(event, handler)
         try:
-            # __NUXT__ 또는 __NUXT_DATA__ 패턴 찾기
-            patterns = [
-                r'<script[^>]*>\s*window\.__NUXT__\s*=\s*(\{.+?\})\s*;?\s*</script>',
-                r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.+?)</script>',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, html, re.DOTALL)
-                if match:
-                    data_str = match.group(1)
-                    # 이미지 URL 추출 (JSON 파싱 없이 정규식으로)
-                    url_pattern = r'https?://image\.idus\.com/image/files/[^"\'\s\\]+(?:\.(?:jpg|jpeg|png|webp|gif))?'
-                    for url_match in re.findall(url_pattern, data_str, re.IGNORECASE):
-                        # 이스케이프 문자 제거
-                        clean_url = url_match.replace('\\/', '/').replace('\\"', '')
-                        if len(clean_url) > 40:
-                            images.add(clean_url)
-        except Exception as e:
-            print(f"NUXT 파싱 오류: {e}")
-        
-        return images
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            quiet_since = loop.time()
+            while loop.time() < deadline:
+                await asyncio.sleep(0.05)
+                if pending:
+                    quiet_since = loop.time()
+                elif loop.time() - quiet_since >= quiet:
+                    return
+        finally:
+            for event, handler in handlers.items():
+                page.remove_listener(event, handler)
+
+    async def _full_scroll(self, page: Page, stop_when_loaded: bool = False):
+        """페이지 전체를 천천히 스크롤 - 스크롤 루프 전체를 페이지 안에서 한 번에 실행
 
-    async def _extract_images_from_dom(self, page: Page) -> list[str]:
-        """DOM에서 이미지 URL 추출 (기본 - URL만)"""
+        stop_when_loaded가 True면 상세 영역 하단이 화면에 들어오고 대기 중인 lazy-load 이미지가 없어지는 즉시 스크롤을 멈춥니다.
+        """
         try:
-            urls = await page.evaluate("""
-                () => {
-                    const urls = new Set();
-                    
-                    // img 태그
-                    document.querySelectorAll('img').forEach(img => {
-                        ['src', 'data-src', 'data-original', 'data-lazy-src'].forEach(attr => {
-                            const url = img.getAttribute(attr);
-                            if (url && url.includes('idus')) urls.add(url);
-                        });
-                        
-                        // srcset
-                        const srcset = img.getAttribute('srcset');
-                        if (srcset) {
-                            srcset.split(',').forEach(part => {
-                                const url = part.trim().split(' ')[0];
-                                if (url && url.includes('idus')) urls.add(url);
-                            });
-                        }
-                    });
-                    
-                    // source 태그
-                    document.querySelectorAll('source').forEach(src => {
-                        const srcset = src.getAttribute('srcset');
-                        if (srcset) {
-                            srcset.split(',').forEach(part => {
-                                const url = part.trim().split(' ')[0];
-                                if (url && url.includes('idus')) urls.add(url);
-                            });
-                        }
+            await page.evaluate("""
+                async ({ step, pause, stopWhenLoaded }) => {
+                    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+                    // 아직 실제 이미지로 바뀌지 않았거나 로드 중인 lazy-load 이미지가 남아 있는지
+                    const hasPendingLazy = () => Array.from(document.images).some(img => {
+                        const lazySrc = img.getAttribute('data-src') ||
+                                        img.getAttribute('data-original') ||
+                                        img.getAttribute('data-lazy-src');
+                        return (lazySrc && img.getAttribute('src') !== lazySrc) ||
+                               (img.loading === 'lazy' && !img.complete);
                     });
+                    // 상세 영역 하단이 화면 안에 들어왔는지 (영역을 모르면 조건 없음)
+                    const target = window.__idusScrollTarget;
+                    const targetInView = () => !target || !target.isConnected ||
+                        target.getBoundingClientRect().bottom <= window.innerHeight;
+                    let current = 0;
+                    let total = document.body.scrollHeight;
+                    // 새 이미지가 나타나지 않은 연속 스크롤 횟수
+                    let prevImageCount = document.images.length;
+                    let idleSteps = 0;
                     
-                    // background-image
-                    document.querySelectorAll('*').forEach(el => {
-                        try {
-                            const bg = getComputedStyle(el).backgroundImage;
-                            if (bg && bg !== 'none') {
-                                const match = bg.match(/url\\(['"]?(https?:\\/\\/[^'"\\)]+)['"]?\\)/);
-                                if (match && match[1].includes('idus')) {
-                                    urls.add(match[1]);
-                                }
-                            }
-                        } catch(e) {}
-                    });
+                    while (current < total) {
+                        window.scrollTo(0, current);
+                        await sleep(pause);
+                        current += step;
+                        total = Math.max(total, document.body.scrollHeight);
+                        
+                        // 화면 하단이 페이지 끝에 닿으면 이후 스크롤은 의미 없음
+                        if (window.scrollY + window.innerHeight >= document.body.scrollHeight) break;
+                        // 대기 중인 lazy-load 이미지가 모두 로드되면 남은 구간은 스크롤하지 않음
+                        if (stopWhenLoaded && !hasPendingLazy() && targetInView()) break;
+                        // 연속 3번 스크롤하는 동안 새 이미지가 없고 대기 중인 이미지도 없으면 더 내려가지 않음
+                        const imageCount = document.images.length;
+                        idleSteps = imageCount === prevImageCount ? idleSteps + 1 : 0;
+                        prevImageCount = imageCount;
+                        if (idleSteps >= 3 && !hasPendingLazy() && targetInView()) break;
+                    }
                     
-                    return Array.from(urls);
+                    // 마지막에 맨 아래까지 확실히 스크롤
+                    window.scrollTo(0, document.body.scrollHeight);
                 }
-            """)
-            return urls or []
-        except Exception as e:
-            print(f"DOM 이미지 추출 오류: {e}")
-            return []
+            """, {'step': 400, 'pause': 300, 'stopWhenLoaded': stop_when_loaded})
+            
+            # 고정 대기 대신 화면에 들어온 이미지 로드가 끝나는 즉시 진행 (최대 1.5초)
+            try:
+                await page.wait_for_function(
+                    "() => Array.from(document.images).every(img => img.complete)",
+                    timeout=1500
+                )
+            except PlaywrightTimeoutError:
+                pass
+            
+        except PlaywrightError as e:
+            logger.warning("스크롤 오류: %s", e)
+
+    async def _extract_images_with_position(self, page: Page, click_tab: bool = True) -> tuple[list[dict], bool]:
+        """상세페이지(작품정보 탭) 영역 내 이미지와 스크롤 필요 여부를 함께 추출 - 탭 패널 기반 (가장 정확)
 
-    async def _extract_images_with_position(self, page: Page) -> list[dict]:
-        """상세페이지(작품정보 탭) 영역 내 이미지만 추출 - 탭 패널 기반 (가장 정확)"""
+        스크롤 필요 여부는 로드 대기 중인 lazy-load 이미지가 있거나 상세 영역 하단이 화면 아래에 있을 때 True입니다.
+        """
         try:
-            # 1단계: 작품정보 탭 클릭하여 해당 콘텐츠 활성화
-            print("   📌 작품정보 탭 클릭 시도...")
-            try:
-                tab_clicked = await page.evaluate("""
-                    () => {
-                        // 방법 1: role="tab" 요소 중 작품정보 찾기
-                        const tabs = document.querySelectorAll('[role="tab"]');
-                        for (const tab of tabs) {
-                            const text = (tab.innerText || tab.textContent || '').trim();
-                            if (text.includes('작품정보') || text === '작품정보') {
-                                tab.click();
-                                return { clicked: true, method: 'role=tab' };
+            # 1단계: 작품정보 탭 클릭하여 해당 콘텐츠 활성화 (스크롤 후 재추출 시에는 생략)
+            if click_tab:
+                logger.debug("작품정보 탭 클릭 시도")
+                try:
+                    tab_clicked = await page.evaluate("""
+                        () => {
+                            // 방법 1: role="tab" 요소 중 작품정보 찾기
+                            const tabs = document.querySelectorAll('[role="tab"]');
+                            for (const tab of tabs) {
+                                const text = (tab.innerText || tab.textContent || '').trim();
+                                if (text.includes('작품정보') || text === '작품정보') {
+                                    tab.click();
+                                    return { clicked: true, method: 'role=tab' };
+                                }
                             }
-                        }
-                        
-                        // 방법 2: 버튼/링크 중 작품정보 찾기
-                        const buttons = document.querySelectorAll('button, a');
-                        for (const btn of buttons) {
-                            const text = (btn.innerText || btn.textContent || '').trim();
-                            if (text === '작품정보' || text === '상품정보') {
-                                btn.click();
-                                return { clicked: true, method: 'button/link' };
+                            
+                            // 방법 2: 버튼/링크 중 작품정보 찾기
+                            const buttons = document.querySelectorAll('button, a');
+                            for (const btn of buttons) {
+                                const text = (btn.innerText || btn.textContent || '').trim();
+                                if (text === '작품정보' || text === '상품정보') {
+                                    btn.click();
+                                    return { clicked: true, method: 'button/link' };
+                                }
                             }
+                            
+                            return { clicked: false };
                         }
-                        
-                        return { clicked: false };
-                    }
-                """)
-                if tab_clicked and tab_clicked.get('clicked'):
-                    await asyncio.sleep(1)  # 탭 콘텐츠 로드 대기
-                    print(f"      ✅ 작품정보 탭 클릭됨 (방법: {tab_clicked.get('method')})")
-            except Exception as e:
-                print(f"      ⚠️ 탭 클릭 실패: {e}")
+                    """)
+                    if tab_clicked and tab_clicked.get('clicked'):
+                        await self._wait_for_tab_panel(page)  # 탭 콘텐츠 로드 대기
+                        logger.debug("작품정보 탭 클릭됨 (방법: %s)", tab_clicked.get('method'))
+                except PlaywrightError as e:
+                    logger.warning("탭 클릭 실패: %s", e)
             
             # 2단계: 탭 패널 기반 이미지 추출 (가장 정확한 방법)
-            images = await page.evaluate("""
-                () => {
+            result = await page.evaluate("""
+                (excludeUrlPatterns) => {
                     const images = [];
                     const seen = new Set();
                     const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
@@ -904,12 +1390,22 @@ class IdusScraper:
                         'comment', 'qna', 'artist-product', 'shop-product',
                         'profile', 'avatar', 'banner', 'popup', 'swiper'
                     ];
+                    // 패턴별 includes 반복 대신 정규식 하나로 한 번에 검사 (호출당 한 번만 생성)
+                    const escapeRe = p => p.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+                    const excludeClassRe = new RegExp(excludePatterns.map(escapeRe).join('|'));
+                    const excludeUrlRe = new RegExp(excludeUrlPatterns.map(escapeRe).join('|'));
                     
-                    // ===== 방법 1: 활성화된 탭 패널에서 이미지 찾기 =====
+                    // ===== 이전 호출에서 찾은 상세 영역 재사용 (스크롤 후 재추출 시 영역 탐색 생략) =====
+                    // 탭 패널/클래스명으로 찾은 영역만 저장하며, 문서에서 떨어졌으면 다시 탐색
                     let targetContainer = null;
+                    const memo = window.__idusDetailContainer;
+                    if (memo && memo.isConnected) {
+                        targetContainer = memo;
+                    }
                     
+                    // ===== 방법 1: 활성화된 탭 패널에서 이미지 찾기 =====
                     // [role="tabpanel"] 중 활성화된 것 찾기
-                    const tabPanels = document.querySelectorAll('[role="tabpanel"]');
+                    const tabPanels = targetContainer ? [] : document.querySelectorAll('[role="tabpanel"]');
                     console.log('탭 패널 수:', tabPanels.length);
                     
                     for (const panel of tabPanels) {
@@ -962,22 +1458,38 @@ class IdusScraper:
                         }
                     }
                     
+                    // 방법 1/2 결과는 다음 호출을 위해 저장 (이미지 수로 고른 방법 3 결과는 스크롤 후 달라질 수 있어 저장 안 함)
+                    if (targetContainer) {
+                        window.__idusDetailContainer = targetContainer;
+                    }
+                    
                     // 방법 3: 이미지가 가장 많은 컨테이너 찾기
                     if (!targetContainer) {
-                        const containers = document.querySelectorAll('article, section, div[class*="content"]');
-                        let maxImgCount = 0;
+                        const containerSelector = 'article, section, div[class*="content"]';
                         
-                        for (const container of containers) {
+                        // idus 이미지에서 위로 올라가며 컨테이너별 이미지 수 집계
+                        // (컨테이너마다 하위 트리를 다시 탐색하지 않음)
+                        const imgCounts = new Map();
+                        for (const img of document.querySelectorAll('img[src*="idus"]')) {
+                            for (let el = img.parentElement; el; el = el.parentElement) {
+                                if (el.matches(containerSelector)) {
+                                    imgCounts.set(el, (imgCounts.get(el) || 0) + 1);
+                                }
+                            }
+                        }
+                        
+                        let maxImgCount = 0;
+                        for (const container of document.querySelectorAll(containerSelector)) {
+                            const imgCount = imgCounts.get(container) || 0;
+                            if (imgCount <= maxImgCount || imgCount < 2) continue;
+                            
                             const classes = (container.className || '').toLowerCase();
                             // 추천/리뷰 영역 제외
-                            if (excludePatterns.some(p => classes.includes(p))) continue;
-                            
-                            const imgs = container.querySelectorAll('img[src*="idus"]');
-                            const rect = container.getBoundingClientRect();
+                            if (excludeClassRe.test(classes)) continue;
                             
                             // 충분한 크기의 컨테이너에서 이미지가 많은 것
-                            if (imgs.length > maxImgCount && imgs.length >= 2 && rect.height > 300) {
-                                maxImgCount = imgs.length;
+                            if (container.getBoundingClientRect().height > 300) {
+                                maxImgCount = imgCount;
                                 targetContainer = container;
                             }
                         }
@@ -1000,19 +1512,13 @@ class IdusScraper:
                                        img.getAttribute('data-original') || img.getAttribute('data-lazy-src') ||
                                        img.dataset?.src || img.dataset?.original;
                             
-                            if (!url) return;
-                            if (!url.includes('idus')) return;
+                            if (!url || !url.startsWith('http')) return;
                             if (seen.has(url)) return;
                             
-                            // URL 패턴으로 명백한 제외
+                            // Idus CDN 이미지만, URL 제외 패턴은 페이지 안에서 적용 (통과한 URL만 Python으로 전달)
                             const urlLower = url.toLowerCase();
-                            if (urlLower.includes('/profile') || urlLower.includes('/avatar') ||
-                                urlLower.includes('/icon') || urlLower.includes('/badge') ||
-                                urlLower.includes('_50.') || urlLower.includes('_100.') ||
-                                urlLower.includes('_150.') || urlLower.includes('_200.') ||
-                                urlLower.includes('/thumb_') || urlLower.includes('/review/')) {
-                                return;
-                            }
+                            if (!urlLower.includes('image.idus.com')) return;
+                            if (excludeUrlRe.test(urlLower)) return;
                             
                             // 이미지 위치/크기 정보
                             const rect = img.getBoundingClientRect();
@@ -1034,13 +1540,10 @@ class IdusScraper:
                             
                             while (parent && parent !== container && depth < 8) {
                                 const classes = (parent.className || '').toString().toLowerCase();
-                                for (const pattern of excludePatterns) {
-                                    if (classes.includes(pattern)) {
-                                        inExcluded = true;
-                                        break;
-                                    }
+                                if (excludeClassRe.test(classes)) {
+                                    inExcluded = true;
+                                    break;
                                 }
-                                if (inExcluded) break;
                                 parent = parent.parentElement;
                                 depth++;
                             }
@@ -1072,49 +1575,63 @@ class IdusScraper:
                     
                     console.log('최종 수집된 이미지:', images.length);
                     
+                    // 아직 실제 이미지로 바뀌지 않은 lazy-load 이미지가 있는지 (별도 왕복 없이 함께 확인)
+                    let pendingLazy = false;
+                    for (const img of document.images) {
+                        const lazySrc = img.getAttribute('data-src') ||
+                                        img.getAttribute('data-original') ||
+                                        img.getAttribute('data-lazy-src');
+                        if ((lazySrc && img.getAttribute('src') !== lazySrc) ||
+                            (img.loading === 'lazy' && !img.complete)) {
+                            pendingLazy = true;
+                            break;
+                        }
+                    }
+                    
+                    // 상세 영역 하단이 화면 아래에 남아 있으면 lazy 표시가 없어도 스크롤 필요
+                    // (보일 때 <img>를 새로 붙이는 섹션은 스크롤 전까지 DOM에 없음)
+                    const scrollTarget = targetContainer || document.body;
+                    window.__idusScrollTarget = scrollTarget;
+                    const belowFold = scrollTarget.getBoundingClientRect().bottom > window.innerHeight;
+                    
                     // Y좌표로 정렬
-                    return images.sort((a, b) => {
+                    images.sort((a, b) => {
                         if (Math.abs(a.y_position - b.y_position) < 20) {
                             return a.x_position - b.x_position;
                         }
                         return a.y_position - b.y_position;
                     });
+                    
+                    // Python에서 쓰는 필드만 반환 (직렬화/역직렬화 최소화)
+                    return {
+                        images: images.map(img => ({ url: img.url, y_position: img.y_position })),
+                        pendingLazy: pendingLazy,
+                        belowFold: belowFold
+                    };
                 }
-            """)
+            """, list(_IMAGE_EXCLUDE_PATTERNS))
             
-            print(f"   📷 탭 패널 기반 이미지 추출: {len(images)}개")
+            images = result.get('images') or []
             if images:
-                print(f"      Y 범위: {images[0].get('y_position', 0):.0f} ~ {images[-1].get('y_position', 0):.0f}")
-            return images or []
+                logger.debug(
+                    "탭 패널 기반 이미지 추출: %d개 (Y 범위: %.0f ~ %.0f)", len(images),
+                    images[0].get('y_position', 0), images[-1].get('y_position', 0),
+                )
+            else:
+                logger.debug("탭 패널 기반 이미지 추출: 0개")
+            return images, bool(result.get('pendingLazy') or result.get('belowFold'))
         except Exception as e:
-            print(f"이미지 추출 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            logger.exception("이미지 추출 오류: %s", e)
+            return [], True
 
     def _filter_images(self, images: list[str]) -> list[str]:
         """이미지 필터링 - 상세페이지 이미지만 유지"""
-        
-        # 명확히 제외할 패턴
-        exclude_patterns = [
-            '/icon', '/sprite', '/logo', '/avatar', '/badge',
-            '/emoji', '/button', '/arrow', '/profile',
-            'facebook.', 'twitter.', 'instagram.', 'kakao.', 'naver.',
-            'google.com', 'apple.com',
-            '/escrow', '/membership', '/banner',
-            '/thumbnail', '/thumb_', '_thumb',  # 썸네일 제외
-            '/review/', '/comment/',  # 후기 이미지 제외
-            '/artist/', '/shop/',  # 작가/샵 이미지 제외
-            'data:image'
-        ]
-        
-        # 크기 기반 제외 패턴 (작은 이미지)
-        small_size_patterns = ['_50.', '_100.', '_150.', '_200.', '_250.']
-        
-        result = []
-        seen_urls = set()
-        seen_file_ids = {}  # 같은 파일의 다른 크기 버전 처리
-        
+
+        # 파일 ID(또는 URL) → (크기, URL), 삽입 순서 = 페이지 순서
+        # 중복 제거와 같은 파일의 크기 버전 비교를 dict 하나로 처리 (별도 집합/크기 맵 없음)
+        selected: dict[str, tuple[int, str]] = {}
+        limit = 15  # 최대 15개로 제한 (OCR 시간 단축)
+
         for img in images:
             if not img or not isinstance(img, str):
                 continue
@@ -1123,73 +1640,48 @@ class IdusScraper:
             if not img.startswith('http'):
                 continue
             
-            # 정확한 URL 중복 체크
-            if img in seen_urls:
-                continue
-            seen_urls.add(img)
-            
+            # SVG / 작은 크기 / 명백한 제외 패턴은 수집 단계(페이지 안)에서 이미 걸러짐
             low = img.lower()
             
-            # SVG 제외
-            if '.svg' in low:
-                continue
-            
-            # 작은 크기 이미지 제외
-            is_small = any(p in low for p in small_size_patterns)
-            if is_small:
-                continue
-            
-            # 명백한 제외 패턴 체크
-            skip = False
-            for pattern in exclude_patterns:
-                if pattern in low:
-                    skip = True
-                    break
-            if skip:
-                continue
-            
             # Idus 이미지 CDN URL인 경우
             if 'image.idus.com' in low:
                 # 파일 ID 추출 (중복 크기 버전 처리)
-                match = re.search(r'files/([a-f0-9]+)', low)
+                match = _FILE_ID_RE.search(low)
                 if match:
                     file_id = match.group(1)
                     
+                    # 상한에 도달한 뒤에는 이미 고른 파일의 더 큰 버전만 의미 있음 (새 파일은 어차피 잘림)
+                    if len(selected) >= limit and file_id not in selected:
+                        continue
+                    
                     # 크기 정보 추출
-                    size_match = re.search(r'_(\d+)\.', low)
+                    size_match = _SIZE_SUFFIX_RE.search(low)
                     size = int(size_match.group(1)) if size_match else 9999  # 크기 없으면 원본
                     
                     # 최소 크기 필터 (300px 이상만)
                     if size_match and size < 300:
                         continue
                     
-                    # 같은 파일 ID가 있으면 더 큰 크기로 교체
-                    if file_id in seen_file_ids:
-                        if size > seen_file_ids[file_id]['size']:
-                            # 이전 URL 제거하고 새 URL 추가
-                            old_url = seen_file_ids[file_id]['url']
-                            if old_url in result:
-                                result.remove(old_url)
-                            seen_file_ids[file_id] = {'size': size, 'url': img}
-                            result.append(img)
-                    else:
-                        seen_file_ids[file_id] = {'size': size, 'url': img}
-                        result.append(img)
-                else:
-                    result.append(img)
+                    # 같은 파일 ID가 있으면 더 큰 크기로 교체 (처음 나온 위치 유지)
+                    prev = selected.get(file_id)
+                    if prev is None or size > prev[0]:
+                        selected[file_id] = (size, img)
+                elif len(selected) < limit:
+                    selected[img] = (0, img)
             else:
                 # Idus CDN이 아닌 다른 이미지는 제외 (상세페이지에는 idus 이미지만 있음)
                 pass
-        
-        print(f"📷 이미지 필터링: {len(images)}개 → {len(result)}개")
-        return result[:15]  # 최대 15개로 제한 (OCR 시간 단축)
+
+        result = [img for _, img in selected.values()]
+        logger.debug("이미지 필터링: %d개 → %d개", len(images), len(result))
+        return result[:limit]
     
     def _filter_images_strict(self, images: list[str], page: Page = None) -> list[str]:
         """엄격한 이미지 필터링 - 폴백 시 사용"""
         
         # 상세페이지 이미지로 추정되는 URL 패턴만 허용
-        result = []
-        seen_file_ids = set()
+        # 파일 ID → URL (중복 제거와 순서 유지를 dict 하나로 처리)
+        selected: dict[str, str] = {}
         
         for img in images:
             if not img or not isinstance(img, str):
@@ -1204,18 +1696,18 @@ class IdusScraper:
                 continue
             
             # 파일 ID 추출
-            match = re.search(r'files/([a-f0-9]+)', low)
+            match = _FILE_ID_RE.search(low)
             if not match:
                 continue
             
             file_id = match.group(1)
             
             # 중복 파일 ID 제외
-            if file_id in seen_file_ids:
+            if file_id in selected:
                 continue
             
             # 크기 정보 추출
-            size_match = re.search(r'_(\d+)\.', low)
+            size_match = _SIZE_SUFFIX_RE.search(low)
             if size_match:
                 size = int(size_match.group(1))
                 # 400px 이상만 (엄격한 필터)
@@ -1223,22 +1715,12 @@ class IdusScraper:
                     continue
             
             # 명백한 제외 패턴
-            exclude_patterns = [
-                '/profile', '/avatar', '/icon', '/badge',
-                '/thumb_', '/thumbnail', '_thumb',
-                '/review', '/comment',
-                '/artist/', '/shop/',
-                '_50.', '_100.', '_150.', '_200.', '_250.', '_300.'
-            ]
-            
-            skip = any(p in low for p in exclude_patterns)
-            if skip:
+            if _STRICT_EXCLUDE_RE.search(low):
                 continue
             
-            seen_file_ids.add(file_id)
-            result.append(img)
+            selected[file_id] = img
         
-        return result[:20]  # 엄격 필터는 20개로 더 제한
+        return list(selected.values())[:20]  # 엄격 필터는 20개로 더 제한
     
     def _sort_images_by_position(self, images: list[str], position_data: list[dict]) -> list[str]:
         """위치 정보를 기반으로 이미지 정렬 (페이지 순서 보장)"""
@@ -1265,7 +1747,7 @@ class IdusScraper:
         
         sorted_images = sorted(images, key=get_order)
         
-        print(f"📷 위치 기반 정렬: {len(sorted_images)}개 이미지 페이지 순서로 정렬됨")
+        logger.debug("위치 기반 정렬: %d개 이미지 페이지 순서로 정렬됨", len(sorted_images))
         return sorted_images
 
 
@@ -220,17 +220,20 @@ class ArtistWebSession:
 
         try:
             all_products = []
-            captured_responses = []
+            # URL → 응답 본문 (SPA가 같은 paging API를 다시 호출해도 한 번만 파싱/집계)
+            captured_responses: dict[str, dict | None] = {}
 
             async def on_api_response(response):
                 """SPA가 호출하는 paging API 응답을 캡처"""
                 try:
                     url = response.url
+                    if url in captured_responses:
+                        return
                     if response.status == 200 and "paging" in url and "idus" in url:
                         ct = response.headers.get("content-type", "")
                         if "json" in ct:
-                            body = await response.json()
-                            captured_responses.append({"url": url, "body": body})
+                            captured_responses[url] = None  # 본문을 기다리는 동안 같은 URL 중복 처리 방지
+                            captured_responses[url] = await response.json()
                             logger.info(f"[API 캡처] 응답 수신: {url}")
                 except Exception:
                     pass
@@ -247,8 +250,9 @@ class ArtistWebSession:
                 self.page.remove_listener("response", on_api_response)
 
             # 캡처된 응답 처리
-            for resp_data in captured_responses:
-                body = resp_data["body"]
+            for resp_url, body in captured_responses.items():
+                if body is None:
+                    continue
                 items = self._find_product_array(body)
                 if not items:
                     continue
@@ -256,7 +260,7 @@ class ArtistWebSession:
                 page_products = self._parse_api_items(items, status)
                 if page_products:
                     all_products.extend(page_products)
-                    logger.info(f"[API 캡처] {len(page_products)}개 작품 추출 (URL: {resp_data['url']})")
+                    logger.info(f"[API 캡처] {len(page_products)}개 작품 추출 (URL: {resp_url})")
 
                     # 페이지네이션 확인
                     has_next = self._check_has_next_page(body, 0, len(items))
@@ -644,21 +648,28 @@ class ArtistWebSession:
         return all_remaining
 
     async def _scroll_to_load_all(self):
-        """무한스크롤 페이지에서 모든 작품을 로드"""
-        prev_height = 0
-        scroll_attempts = 0
-        max_scrolls = 20
-
-        while scroll_attempts < max_scrolls:
-            current_height = await self.page.evaluate("document.body.scrollHeight")
-            if current_height == prev_height:
-                break
-            prev_height = current_height
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1)
-            scroll_attempts += 1
-
-        await self.page.evaluate("window.scrollTo(0, 0)")
+        """무한스크롤 페이지에서 모든 작품을 로드 — 스크롤 루프 전체를 페이지 안에서 한 번에 실행"""
+        scroll_attempts = await self.page.evaluate("""
+            async ({ maxScrolls, settleMs, pollMs }) => {
+                const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+                let attempts = 0;
+                let prevHeight = 0;
+                while (attempts < maxScrolls) {
+                    const height = document.body.scrollHeight;
+                    if (height === prevHeight) break;
+                    prevHeight = height;
+                    window.scrollTo(0, height);
+                    attempts++;
+                    // 고정 1초 대기 대신 높이가 늘어나는 즉시 다음 스크롤 (최대 settleMs)
+                    for (let waited = 0; waited < settleMs; waited += pollMs) {
+                        await sleep(pollMs);
+                        if (document.body.scrollHeight !== height) break;
+                    }
+                }
+                window.scrollTo(0, 0);
+                return attempts;
+            }
+        """, {"maxScrolls": 20, "settleMs": 1000, "pollMs": 150})
         logger.debug(f"스크롤 완료: {scroll_attempts}회")
 
     async def get_page_debug_info(self) -> dict:
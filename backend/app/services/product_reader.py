@@ -439,29 +439,37 @@ class ProductReader:
         keywords = []
 
         try:
+            # 네 필드 값을 한 번의 evaluate로 읽기 (필드마다 count + input_value 왕복 없음)
+            values = await self.page.evaluate("""
+                (selectors) => Object.fromEntries(Object.entries(selectors).map(([key, sel]) => {
+                    const el = document.querySelector(sel);
+                    return [key, el ? el.value : null];
+                }))
+            """, {
+                'title': 'textarea[name="productName"]',
+                'price': 'input[name="product_price"]',
+                'category': 'input[name="productCategory"]',
+                'keywords': 'input[name="product_keyword"]',
+            })
+
             # 제목
-            el = self.page.locator('textarea[name="productName"]').first
-            if await el.count() > 0:
-                title = (await el.input_value()).strip()
+            if values.get('title') is not None:
+                title = values['title'].strip()
 
             # 가격
-            el = self.page.locator('input[name="product_price"]').first
-            if await el.count() > 0:
-                val = await el.input_value()
+            val = values.get('price')
+            if val:
                 import re
-                price = int(re.sub(r'[^\d]', '', val)) if val else 0
+                price = int(re.sub(r'[^\d]', '', val) or 0)
 
             # 카테고리
-            el = self.page.locator('input[name="productCategory"]').first
-            if await el.count() > 0:
-                category = (await el.input_value()).strip()
+            if values.get('category') is not None:
+                category = values['category'].strip()
 
             # 키워드
-            el = self.page.locator('input[name="product_keyword"]').first
-            if await el.count() > 0:
-                val = await el.input_value()
-                if val:
-                    keywords = [k.strip().lstrip('#') for k in val.split(',') if k.strip()]
+            val = values.get('keywords')
+            if val:
+                keywords = [k.strip().lstrip('#') for k in val.split(',') if k.strip()]
 
         except Exception as e:
             logger.warning(f"[DOM 폴백] 추출 오류: {e}")
@@ -14,6 +14,7 @@ GB 등록에 특화된 번역 로직을 제공합니다.
 import asyncio
 import logging
 import os
+import re
 from typing import Optional
 
 import httpx
@@ -22,6 +23,7 @@ from ..models.domestic import DomesticProduct, DomesticOption
 from ..models.global_product import GlobalProductData, LanguageData, GlobalOption, ImageText
 from ..config import settings
 from .claude_client import ClaudeTranslator
+from .http_client import create_image_http_client
 
 from ..prompts import (
     GB_TITLE_PROMPT_EN, GB_DESCRIPTION_PROMPT_EN,
@@ -34,6 +36,25 @@ from ..prompts import (
 
 logger = logging.getLogger(__name__)
 
+# HTML ↔ 블록 변환용 정규식 (블록/줄마다 반복 사용되므로 모듈 로드 시 한 번만 컴파일)
+_BLOCK_SPLIT_RE = re.compile(r'(<h[23][^>]*>.*?</h[23]>|<hr\s*/?>)', re.DOTALL)
+_HEADING_RE = re.compile(r'<h[23][^>]*>(.*?)</h[23]>', re.DOTALL)
+_HR_RE = re.compile(r'<hr\s*/?>')
+_PARAGRAPH_RE = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_LINE_RE = re.compile(r'^[A-Za-z\s&\u3000-\u9fff\uac00-\ud7ff]+$')
+_BOLD_LINE_RE = re.compile(r'^\*\*(.+?)\*\*[:\s]')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_LABEL_LINE_RE = re.compile(r'^[A-Z][a-z]+.*:')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 한글 문자 (OCR 텍스트 재검사용, 혼합 텍스트도 감지)
+_KOREAN_RE = re.compile(r'[\uac00-\ud7a3]')
+
+# 이미지 URL 크기 접미사 / 확장자 (고해상도 URL 변환용, 이미지마다 호출됨)
+_SIZE_SUFFIX_RE = re.compile(r'_\d+\.(jpg|jpeg|png|webp|gif)$')
+_IMAGE_EXT_RE = re.compile(r'\.(jpg|jpeg|png|webp|gif)$')
+
 
 class GBProductTranslator:
     """GB 등록 전용 번역기
@@ -56,6 +77,8 @@ class GBProductTranslator:
         """
         self.translator = base_translator  # Gemini (legacy)
         self.claude = claude_translator    # Claude (primary)
+        # 이미지 다운로드용 keep-alive 클라이언트 (같은 CDN 호스트 연결 재사용, 지연 생성)
+        self._http: Optional[httpx.AsyncClient] = None
 
     @property
     def is_initialized(self) -> bool:
@@ -273,9 +296,8 @@ class GBProductTranslator:
         if domestic.features:
             parts.append(f"특장점: {' / '.join(domestic.features)}")
         if domestic.description_html:
-            import re as _re
-            clean_text = _re.sub(r'<[^>]+>', ' ', domestic.description_html)
-            clean_text = _re.sub(r'\s+', ' ', clean_text).strip()
+            clean_text = _TAG_RE.sub(' ', domestic.description_html)
+            clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
             if clean_text:
                 parts.append(f"설명: {clean_text[:500]}")
         if domestic.options:
@@ -339,21 +361,16 @@ class GBProductTranslator:
         2. ocr_results의 텍스트를 regex로 재검사하여 한글 포함 이미지 추가 필터링
         3. product_images도 OCR 결과가 있으면 동일하게 검사
         """
-        import re as _re
-
         # OCR 결과에서 URL → 텍스트 매핑 구성
         ocr_text_by_url: dict[str, str] = {}
         if ocr_results:
             for r in ocr_results:
                 ocr_text_by_url[r["image_url"]] = r.get("original_text", "")
 
-        # 한글 문자 regex 패턴 (혼합 텍스트도 감지)
-        korean_pattern = _re.compile(r'[\uac00-\ud7a3]')
-
         # korean_image_urls 확장: OCR 텍스트에서 한글이 포함된 URL 추가
         filtered_urls = set(korean_image_urls)
         for url, text in ocr_text_by_url.items():
-            if korean_pattern.search(text):
+            if _KOREAN_RE.search(text):
                 if url not in filtered_urls:
                     logger.info(f"[한글 필터] OCR 한글 감지로 제외: {url[:80]}...")
                     filtered_urls.add(url)
@@ -490,12 +507,11 @@ class GBProductTranslator:
     @staticmethod
     def _html_to_blocks(html: str) -> list[dict]:
         """HTML을 premiumDescription 블록 배열로 변환"""
-        import re
         blocks = []
 
         # HTML 태그 기반 분리
         # <h3>...</h3> → SUBJECT, <p>...</p> → TEXT, <hr /> → LINE
-        parts = re.split(r'(<h[23][^>]*>.*?</h[23]>|<hr\s*/?>)', html, flags=re.DOTALL)
+        parts = _BLOCK_SPLIT_RE.split(html)
 
         for part in parts:
             part = part.strip()
@@ -503,29 +519,29 @@ class GBProductTranslator:
                 continue
 
             # h2/h3 → SUBJECT (타이틀)
-            h_match = re.match(r'<h[23][^>]*>(.*?)</h[23]>', part, re.DOTALL)
+            h_match = _HEADING_RE.match(part)
             if h_match:
-                text = re.sub(r'<[^>]+>', '', h_match.group(1)).strip()
+                text = _TAG_RE.sub('', h_match.group(1)).strip()
                 if text:
                     blocks.append(GBProductTranslator._make_block("SUBJECT", text))
                 continue
 
             # hr → LINE (구분선)
-            if re.match(r'<hr\s*/?>', part):
+            if _HR_RE.match(part):
                 blocks.append(GBProductTranslator._make_block("LINE"))
                 continue
 
             # 나머지: p 태그들 → TEXT
             # 여러 <p>가 연속일 수 있으므로 각각 분리
-            p_parts = re.findall(r'<p[^>]*>(.*?)</p>', part, re.DOTALL)
+            p_parts = _PARAGRAPH_RE.findall(part)
             if p_parts:
                 for p_text in p_parts:
-                    clean = re.sub(r'<[^>]+>', '', p_text).strip()
+                    clean = _TAG_RE.sub('', p_text).strip()
                     if clean:
                         blocks.append(GBProductTranslator._make_block("TEXT", clean))
             else:
                 # 태그 없는 순수 텍스트
-                clean = re.sub(r'<[^>]+>', '', part).strip()
+                clean = _TAG_RE.sub('', part).strip()
                 if clean:
                     blocks.append(GBProductTranslator._make_block("TEXT", clean))
 
@@ -534,7 +550,6 @@ class GBProductTranslator:
     @staticmethod
     def _ensure_html_tags(text: str) -> str:
         """Gemini 응답에 HTML 태그가 없으면 자동 추가"""
-        import re
         # 이미 HTML 태그가 있으면 그대로 반환
         if '<h3>' in text or '<p>' in text or '<h2>' in text:
             return text
@@ -550,13 +565,13 @@ class GBProductTranslator:
             if (len(line) < 60
                     and not line.endswith('.')
                     and not line.endswith(':')
-                    and re.match(r'^[A-Za-z\s&\u3000-\u9fff\uac00-\ud7ff]+$', line)):
+                    and _TITLE_LINE_RE.match(line)):
                 html_parts.append(f'<h3>{line}</h3>')
             # 볼드 키워드: "**text**:" 또는 "Text:" 패턴
-            elif re.match(r'^\*\*(.+?)\*\*[:\s]', line):
-                clean = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', line)
+            elif _BOLD_LINE_RE.match(line):
+                clean = _BOLD_RE.sub(r'<strong>\1</strong>', line)
                 html_parts.append(f'<p>{clean}</p>')
-            elif re.match(r'^[A-Z][a-z]+.*:', line) and len(line) < 200:
+            elif _LABEL_LINE_RE.match(line) and len(line) < 200:
                 parts = line.split(':', 1)
                 html_parts.append(f'<p><strong>{parts[0]}:</strong>{parts[1]}</p>')
             else:
@@ -702,27 +717,36 @@ class GBProductTranslator:
         if not url:
             return url
         # 이미 접미사가 있으면 교체, 없으면 추가
-        import re
-        base = re.sub(r'_\d+\.(jpg|jpeg|png|webp|gif)$', r'.\1', url)
+        base = _SIZE_SUFFIX_RE.sub(r'.\1', url)
         # 확장자 앞에 _1000 삽입
-        return re.sub(r'\.(jpg|jpeg|png|webp|gif)$', r'_1000.\1', base)
+        return _IMAGE_EXT_RE.sub(r'_1000.\1', base)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = create_image_http_client()
+        return self._http
+
+    async def aclose(self):
+        """이미지 다운로드용 HTTP 클라이언트 정리 (서버 종료 시 호출)"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _download_image(self, url: str) -> tuple[Optional[bytes], str]:
         """이미지 다운로드 + MIME 타입 반환"""
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(url)
-                if resp.status_code != 200:
-                    return None, ""
-                ct = resp.headers.get("content-type", "").lower()
-                mime = "image/jpeg"
-                if "png" in ct:
-                    mime = "image/png"
-                elif "webp" in ct:
-                    mime = "image/webp"
-                elif "gif" in ct:
-                    mime = "image/gif"
-                return resp.content, mime
+            resp = await self._get_http_client().get(url)
+            if resp.status_code != 200:
+                return None, ""
+            ct = resp.headers.get("content-type", "").lower()
+            mime = "image/jpeg"
+            if "png" in ct:
+                mime = "image/png"
+            elif "webp" in ct:
+                mime = "image/webp"
+            elif "gif" in ct:
+                mime = "image/gif"
+            return resp.content, mime
         except Exception as e:
             logger.warning(f"이미지 다운로드 실패: {e}")
             return None, ""
@@ -7,7 +7,8 @@ import asyncio
 import base64
 import httpx
 import os
-import traceback
+import logging
+import re
 from typing import Optional
 
 # 새로운 google-genai 라이브러리
@@ -31,6 +32,12 @@ from ..prompts import (
     ENGLISH_TITLE_PROMPT,
     ENGLISH_OPTION_PROMPT,
 )
+from .http_client import create_image_http_client
+
+logger = logging.getLogger(__name__)
+
+# 고해상도(500px 이상) 이미지 URL 패턴: 파일명 접미사(_720.) 또는 경로(/720/) - 두 패턴을 한 번에 검사
+_HIGH_RES_RE = re.compile(r'_([5-9]\d{2}|[1-9]\d{3})\.|/([5-9]\d{2}|[1-9]\d{3})/')
 
 
 class ProductTranslator:
@@ -47,15 +54,18 @@ class ProductTranslator:
         self._last_request_time = 0
         self._max_retries = 3
         
+        # OCR 이미지 다운로드용 keep-alive 클라이언트 (지연 생성)
+        self._http: Optional[httpx.AsyncClient] = None
+        
         if api_key:
             self._initialize_client(api_key)
         else:
-            print("⚠️ GEMINI_API_KEY가 설정되지 않았습니다")
+            logger.warning("GEMINI_API_KEY가 설정되지 않았습니다")
     
     def _initialize_client(self, api_key: str):
         """Gemini 클라이언트 초기화"""
         try:
-            print(f"🔧 Gemini API 초기화 중... (키 길이: {len(api_key)})")
+            logger.info("Gemini API 초기화 중... (키 길이: %d)", len(api_key))
             
             self.client = genai.Client(api_key=api_key)
             
@@ -74,7 +84,7 @@ class ProductTranslator:
             
             for model_name in model_candidates:
                 try:
-                    print(f"🔄 모델 시도: {model_name}")
+                    logger.debug("모델 시도: %s", model_name)
                     
                     response = self.client.models.generate_content(
                         model=model_name,
@@ -84,35 +94,46 @@ class ProductTranslator:
                     if response and response.text:
                         self._model_name = model_name
                         self._initialized = True
-                        print(f"✅ 모델 선택 성공: {model_name}")
+                        logger.info("모델 선택 성공: %s", model_name)
                         return
                         
                 except Exception as e:
                     error_str = str(e)
                     if "leaked" in error_str.lower() or "PERMISSION_DENIED" in error_str:
-                        print(f"   ⛔ API 키 차단됨! 새 API 키가 필요합니다.")
+                        logger.error("API 키 차단됨! 새 API 키가 필요합니다.")
                         api_key_leaked = True
                         break  # 더 이상 시도하지 않음
                     elif "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                        print(f"   ⚠️ {model_name}: Quota 초과 - 다음 모델 시도")
+                        logger.warning("%s: Quota 초과 - 다음 모델 시도", model_name)
                     elif "404" in error_str or "not found" in error_str.lower():
-                        print(f"   ⚠️ {model_name}: 사용 불가")
+                        logger.warning("%s: 사용 불가", model_name)
                     else:
-                        print(f"   ⚠️ {model_name}: {str(e)[:100]}")
+                        logger.warning("%s: %s", model_name, str(e)[:100])
                     continue
             
             if api_key_leaked:
-                print("="*60)
-                print("⛔ API 키가 유출로 보고되어 차단되었습니다!")
-                print("   새 API 키를 생성하세요: https://aistudio.google.com/apikey")
-                print("   Railway 환경 변수 GEMINI_API_KEY를 업데이트하세요.")
-                print("="*60)
+                logger.error(
+                    "API 키가 유출로 보고되어 차단되었습니다! "
+                    "새 API 키를 생성하세요: https://aistudio.google.com/apikey "
+                    "(Railway 환경 변수 GEMINI_API_KEY를 업데이트하세요)"
+                )
             else:
-                print("❌ 사용 가능한 모델을 찾을 수 없습니다")
+                logger.error("사용 가능한 모델을 찾을 수 없습니다")
             
         except Exception as e:
-            print(f"❌ Gemini 초기화 실패: {e}")
-            traceback.print_exc()
+            logger.exception("Gemini 초기화 실패: %s", e)
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """OCR 이미지 다운로드용 공유 클라이언트 (처음 사용할 때 생성, 닫혔으면 다시 생성)"""
+        if self._http is None or self._http.is_closed:
+            self._http = create_image_http_client()
+        return self._http
+    
+    async def aclose(self):
+        """OCR 이미지 다운로드용 HTTP 클라이언트 정리 (서버 종료 시 호출)"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     async def _wait_for_rate_limit(self):
         """Rate Limit을 위한 대기"""
@@ -122,24 +143,19 @@ class ProductTranslator:
         
         if elapsed < self._request_delay:
             wait_time = self._request_delay - elapsed
-            print(f"   ⏳ Rate Limit 대기: {wait_time:.1f}초")
+            logger.debug("Rate Limit 대기: %.1f초", wait_time)
             await asyncio.sleep(wait_time)
         
         self._last_request_time = time.time()
     
     def _prioritize_high_res_images(self, images: list[str]) -> list[str]:
         """고해상도 이미지를 우선 정렬 (OCR 품질 향상)"""
-        import re
-        
         high_res = []  # _720, _800, _1000 등
         normal = []
         
         for img in images:
-            low = img.lower()
-            # 고해상도 패턴 확인
-            if re.search(r'_([5-9]\d{2}|[1-9]\d{3})\.', low):  # _500 이상
-                high_res.append(img)
-            elif re.search(r'/([5-9]\d{2}|[1-9]\d{3})/', low):  # /500/ 이상
+            # 고해상도 패턴 확인 (_500 이상 또는 /500/ 이상)
+            if _HIGH_RES_RE.search(img.lower()):
                 high_res.append(img)
             else:
                 normal.append(img)
@@ -178,12 +194,10 @@ class ProductTranslator:
     ) -> TranslatedProduct:
         """상품 데이터 전체 번역"""
         
-        print(f"\n{'='*50}")
-        print(f"🔄 번역 시작 (모델: {self._model_name}, 초기화: {self._initialized})")
-        print(f"{'='*50}")
+        logger.info("번역 시작 (모델: %s, 초기화: %s)", self._model_name, self._initialized)
         
         if not self._initialized or not self.client:
-            print("⚠️ 모델 미초기화 - 원본 데이터 반환")
+            logger.warning("모델 미초기화 - 원본 데이터 반환")
             return TranslatedProduct(
                 original=product_data,
                 translated_title=product_data.title,
@@ -194,19 +208,19 @@ class ProductTranslator:
             )
         
         # 1. 제목 번역 (간결한 프롬프트 사용)
-        print(f"📝 제목 번역: {product_data.title[:30]}...")
+        logger.info("제목 번역: %s...", product_data.title[:30])
         translated_title = await self._translate_text_with_retry(
             product_data.title, target_language, "title"
         )
         
         # 2. 설명 번역 (전문 프롬프트 사용)
-        print(f"📝 설명 번역: {len(product_data.description)}자")
+        logger.info("설명 번역: %d자", len(product_data.description))
         translated_description = await self._translate_text_with_retry(
             product_data.description, target_language, "description"
         )
         
         # 3. 옵션 번역
-        print(f"📝 옵션 번역: {len(product_data.options)}개")
+        logger.info("옵션 번역: %d개", len(product_data.options))
         translated_options = await self._translate_options(
             product_data.options, target_language
         )
@@ -217,12 +231,12 @@ class ProductTranslator:
         # 고해상도 이미지 우선 정렬 (_720, _800 등)
         sorted_images = self._prioritize_high_res_images(product_data.detail_images)
         
-        print(f"📝 OCR: {len(sorted_images)}개 이미지 중 최대 {max_ocr}개 처리")
+        logger.info("OCR: %d개 이미지 중 최대 %d개 처리", len(sorted_images), max_ocr)
         translated_image_texts = await self._process_images(
             sorted_images[:max_ocr], target_language
         )
         
-        print(f"✅ 번역 완료!")
+        logger.info("번역 완료")
         
         return TranslatedProduct(
             original=product_data,
@@ -251,10 +265,10 @@ class ProductTranslator:
                 if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
                     # 429 에러: 더 오래 대기
                     wait_time = (attempt + 1) * 12  # 12초, 24초, 36초
-                    print(f"   ⏳ Rate Limit 초과, {wait_time}초 대기 후 재시도...")
+                    logger.warning("Rate Limit 초과, %d초 대기 후 재시도...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
-                    print(f"   ❌ 번역 실패: {e}")
+                    logger.warning("번역 실패: %s", e)
                     return text
         
         return text
@@ -291,7 +305,7 @@ class ProductTranslator:
                 if result.startswith(prefix):
                     result = result[len(prefix):].strip()
             
-            print(f"   ✅ 번역 성공 ({context})")
+            logger.debug("번역 성공 (%s)", context)
             return result
         
         return text
@@ -314,7 +328,7 @@ class ProductTranslator:
                     
                 result.append(ProductOption(name=name, values=values))
             except Exception as e:
-                print(f"   ❌ 옵션 번역 실패: {e}")
+                logger.warning("옵션 번역 실패: %s", e)
                 result.append(opt)
         return result
     
@@ -326,7 +340,7 @@ class ProductTranslator:
         
         for idx, url in enumerate(image_urls):
             try:
-                print(f"   [{idx+1}/{len(image_urls)}] OCR: {url[:50]}...")
+                logger.debug("[%d/%d] OCR: %s...", idx + 1, len(image_urls), url[:50])
                 
                 # Rate Limit 대기
                 await self._wait_for_rate_limit()
@@ -335,7 +349,7 @@ class ProductTranslator:
                 ocr_text = await self._ocr_image_with_retry(url)
                 
                 if ocr_text and len(ocr_text) > 10:
-                    print(f"      ✅ 텍스트 발견: {len(ocr_text)}자")
+                    logger.debug("텍스트 발견: %d자", len(ocr_text))
                     
                     # 번역 (OCR 텍스트는 일반 번역 프롬프트 사용)
                     translated = await self._translate_text_with_retry(
@@ -351,14 +365,14 @@ class ProductTranslator:
                         y_position=float(idx * 100)  # 상대적 위치 (정렬용)
                     ))
                 else:
-                    print(f"      ⬜ 텍스트 없음")
+                    logger.debug("텍스트 없음")
                     
             except Exception as e:
-                print(f"      ❌ OCR 오류: {e}")
+                logger.warning("OCR 오류: %s", e)
         
         # 순서대로 정렬된 결과 반환
         results.sort(key=lambda x: x.order_index)
-        print(f"   📊 OCR 결과: {len(results)}개 (순서 정렬됨)")
+        logger.info("OCR 결과: %d개 (순서 정렬됨)", len(results))
         
         return results
     
@@ -371,7 +385,7 @@ class ProductTranslator:
                 error_str = str(e)
                 if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
                     wait_time = (attempt + 1) * 12
-                    print(f"      ⏳ Rate Limit, {wait_time}초 대기...")
+                    logger.warning("Rate Limit, %d초 대기...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     raise e
@@ -383,11 +397,10 @@ class ProductTranslator:
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(image_url)
-                if resp.status_code != 200:
-                    return None
-                image_data = resp.content
+            resp = await self._get_http_client().get(image_url)
+            if resp.status_code != 200:
+                return None
+            image_data = resp.content
             
             # MIME 타입
             ct = resp.headers.get("content-type", "").lower()
@@ -0,0 +1,15 @@
+"""
+번역기 공용 HTTP 클라이언트
+
+OCR용 이미지 다운로드에 쓰는 keep-alive 클라이언트를 한 곳에서 생성합니다.
+"""
+import httpx
+
+
+def create_image_http_client() -> httpx.AsyncClient:
+    """이미지 다운로드용 keep-alive 클라이언트 생성 (호출한 쪽에서 aclose로 정리)"""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    )
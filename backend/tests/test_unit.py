@@ -43,6 +43,11 @@ check("batch_max_size", s.batch_max_size == 10)
 check("batch_item_delay", s.batch_item_delay == 3.0)
 check("cors_origins 기본값", s.cors_origins == ["*"])
 check("gemini_api_key 기본값 None", s.gemini_api_key is None)
+check("scraper_max_pages 기본값", s.scraper_max_pages == 8)
+check("scraper_warm_pages 기본값", s.scraper_warm_pages == 2)
+check("scraper_cache_ttl 기본값", s.scraper_cache_ttl == 300.0)
+check("scraper_single_process 기본값", s.scraper_single_process is False)
+check("scraper_stealth 기본값", s.scraper_stealth == "full")
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 2. Domestic Models
@@ -265,6 +270,75 @@ bp2 = BatchProgress(total=4, completed=3, failed=1, items=[])
 check("BatchProgress.is_done (4==3+1)", bp2.is_done is True)
 check("BatchProgress.success_rate", abs(bp2.success_rate - 0.75) < 0.01)
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 8. 소비자 페이지 크롤러 유틸리티 (브라우저 없이 검증)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+print("\n[8] 소비자 페이지 크롤러 유틸리티")
+import asyncio
+from app.scraper.consumer_page import (
+    IdusScraper, _normalize_product_url, _is_blocked_host, _should_block_request,
+)
+from app.models.v1 import ProductData as V1ProductData
+
+# URL 정규화 (캐시/중복 제거 키)
+key = _normalize_product_url("https://www.idus.com/v2/product/abc-123?utm_source=x#top")
+check("상품 ID 기반 키", key == "product:abc-123", key)
+check("경로/쿼리가 달라도 같은 상품", key == _normalize_product_url("https://WWW.idus.com/w/product/abc-123/"))
+check("상품 ID 없으면 호스트 소문자 + 끝 슬래시 제거",
+      _normalize_product_url("https://WWW.Idus.com/event/?a=1") == "www.idus.com/event")
+
+# 차단 호스트 (서브도메인 포함, 부분 문자열은 불일치)
+check("차단 호스트 정확히 일치", _is_blocked_host("google-analytics.com"))
+check("차단 호스트 서브도메인", _is_blocked_host("www.google-analytics.com"))
+check("비슷한 이름의 다른 도메인은 허용", not _is_blocked_host("notfacebook.com"))
+check("idus 이미지 CDN 허용", not _is_blocked_host("image.idus.com"))
+check("폰트 타입 차단", _should_block_request("font", "https://www.idus.com/a.woff2", False))
+check("쿼리에 차단 호스트가 있어도 허용",
+      not _should_block_request("script", "https://www.idus.com/x?u=https://facebook.com/", False))
+check("외부 도메인 iframe 문서 차단", _should_block_request("document", "https://ads.example.com/", True))
+check("idus iframe 문서 허용", not _should_block_request("document", "https://www.idus.com/w", True))
+check("메인 문서 허용", not _should_block_request("document", "https://login.example.com/", False))
+
+# 이미지 필터링 (파일별 가장 큰 크기 버전, 처음 나온 위치 유지, 300px 미만 제외, 최대 15개)
+scraper = IdusScraper()
+cdn = "https://image.idus.com/image/files/"
+filtered = scraper._filter_images([
+    cdn + "aaaa_320.jpg", cdn + "bbbb_720.jpg", cdn + "aaaa_1000.jpg",
+    cdn + "cccc_200.jpg", "https://other.com/dddd_720.jpg", "/relative.jpg", None,
+])
+check("같은 파일은 가장 큰 버전으로", filtered[0] == cdn + "aaaa_1000.jpg", filtered)
+check("처음 나온 위치 유지", filtered == [cdn + "aaaa_1000.jpg", cdn + "bbbb_720.jpg"], filtered)
+many = [f"{cdn}{i:04x}_720.jpg" for i in range(20)]
+check("최대 15개", scraper._filter_images(many) == many[:15])
+
+# 여러 URL 크롤링: 순서 유지, 같은 상품은 한 번만, 실패는 해당 자리에 예외
+calls = []
+
+async def fake_scrape_product(url):
+    calls.append(url)
+    await asyncio.sleep(0)
+    if "fail" in url:
+        raise RuntimeError("boom")
+    return V1ProductData(
+        url=url, title="t", artist_name="a", price="1", description="d",
+        options=[], detail_images=[], image_texts=[],
+    )
+
+scraper._initialized = True
+scraper.scrape_product = fake_scrape_product
+urls = [
+    "https://www.idus.com/v2/product/p1",
+    "https://www.idus.com/v2/product/fail",
+    "https://www.idus.com/v2/product/p1?ref=dup",
+    "https://www.idus.com/v2/product/p2",
+]
+results = asyncio.run(scraper.scrape_products(urls))
+check("결과 수 = URL 수", len(results) == 4)
+check("같은 상품은 한 번만 크롤링", len(calls) == 3, calls)
+check("결과 순서 유지", results[0].url.endswith("p1") and results[3].url.endswith("p2"))
+check("실패 URL 자리에 예외", isinstance(results[1], RuntimeError))
+check("중복 URL은 별도 복사본", results[2] is not results[0] and results[2].url == results[0].url)
+
 # ━━━━━━━━━ 결과 ━━━━━━━━━
 print("\n" + "=" * 60)
 total = passed + failed